@@ -1,78 +1,310 @@
 #!/usr/bin/env python
 
 
+import array
 import os
-import glob
 import math
+import pickle
 import sys
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # ── config ───────────────────────────────────────────────────────────────────
 RESULTS_DIR     = "results"
 TARGET_COVERAGE = 0.95
-EXPECTED_SIZES  = [10, 20, 50]
 # ─────────────────────────────────────────────────────────────────────────────
 
 
 # ── statistics ────────────────────────────────────────────────────────────────
+def _welford(a):
+    """Single-pass running mean/M2 (Welford).  Returns (n, mean, M2)."""
+    n = 0
+    m = 0.0
+    m2 = 0.0
+    for x in a:
+        n += 1
+        d = x - m
+        m += d / n
+        m2 += d * (x - m)
+    return n, m, m2
+
+
+if njit is not None:
+    _welford = njit(cache=True, fastmath=True)(_welford)
+
+
 def _mean(vals):
-    return sum(vals) / len(vals) if vals else float("nan")
+    n, m, _ = _welford(np.asarray(vals, np.float64))
+    return m if n else float("nan")
 
 def _std(vals):
-    if len(vals) < 2:
-        return 0.0
-    m = _mean(vals)
-    return math.sqrt(sum((v - m) ** 2 for v in vals) / (len(vals) - 1))
+    n, _, m2 = _welford(np.asarray(vals, np.float64))
+    return math.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+
+def _nan_mean_std(arr):
+    """(mean, sample std) of the non-NaN entries, matching _mean/_std
+    conventions: mean is NaN when empty, std is 0.0 below two values."""
+    arr = arr[~np.isnan(arr)]
+    if arr.size == 0:
+        return float("nan"), 0.0
+    if arr.size == 1:
+        return float(arr[0]), 0.0
+    return float(arr.mean()), float(arr.std(ddof=1))
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def _load_dir(log_dir):
+LOG_COLUMNS = ["ts", "ev", "mt", "mid"]
+
+# Event/type codes used throughout the scans:
+# ev 0=SEND 1=RECEIVE 2=other, mt 0=GOSSIP 1=other.
+EV_SEND, EV_RECEIVE = 0, 1
+MT_GOSSIP = 0
+
+
+def _scan_logs(log_dir):
     """
-    Read all node_*.log files from log_dir.
-    Returns  per_node: dict  port(int) -> [(ts, event, msg_type, msg_id), ...]
+    List node log files in log_dir with one scandir batch (no fnmatch).
+    Returns [(port, path), ...] sorted by port.
     """
-    per_node = {}
-    for path in glob.glob(os.path.join(log_dir, "node_*.log")):
-        try:
-            port = int(os.path.basename(path)
-                         .replace("node_", "").replace(".log", ""))
-        except ValueError:
-            continue
-        rows = []
-        with open(path) as fh:
-            for line in fh:
-                parts = line.strip().split(",", 3)
-                if len(parts) == 4:
+    out = []
+    try:
+        with os.scandir(log_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("node_") and name.endswith(".log"):
                     try:
-                        rows.append((int(parts[0]), parts[1],
-                                     parts[2], parts[3]))
+                        out.append((int(name[5:-4]), entry.path))
                     except ValueError:
-                        pass
-        per_node[port] = rows
-    return per_node
+                        continue
+    except NotADirectoryError:
+        pass
+    return sorted(out)
 
 
-def _find_injector(per_node):
+def _read_log(path):
+    """
+    Parse one node log; bad rows are dropped.  Uses pyarrow's reader
+    when available (multithreaded block tokenization with SIMD delimiter
+    search), else pandas' C tokenizer.
     """
-    Return (injector_port, msg_id, origin_ts).
+    df = None
+    if pacsv is not None:
+        try:
+            df = pacsv.read_csv(
+                path,
+                read_options=pacsv.ReadOptions(column_names=LOG_COLUMNS,
+                                               use_threads=True),
+                parse_options=pacsv.ParseOptions(
+                    delimiter=",", invalid_row_handler=lambda _: "skip"),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={c: pa.string() for c in LOG_COLUMNS}),
+            ).to_pandas()
+        except pa.ArrowInvalid:
+            df = None   # fall through to the more forgiving pandas reader
+    if df is None:
+        try:
+            df = pd.read_csv(path, header=None, names=LOG_COLUMNS,
+                             dtype={"ts": "string", "ev": "category",
+                                    "mt": "category", "mid": "string"},
+                             engine="c", on_bad_lines="skip",
+                             memory_map=True)
+        except (pd.errors.EmptyDataError, ValueError):
+            # Zero-byte log (e.g. a node that crashed before writing):
+            # memory_map surfaces it as "cannot mmap an empty file"
+            # (ValueError) instead of EmptyDataError.  No rows either way.
+            return pd.DataFrame(columns=LOG_COLUMNS)
+    # Rows whose timestamp is not an integer (the old per-line ValueError
+    # guard) are discarded here instead.
+    ts = pd.to_numeric(df["ts"], errors="coerce")
+    df = df[ts.notna()]
+    df["ts"] = ts[ts.notna()].astype("int64")
+    return df
+
+
+def _load_dir(log_dir):
+    """
+    Read all node_*.log files from log_dir into one columnar run record,
+    encoded in a single pass:
+
+        ts        int64[:]   timestamps (file order, time-ordered per port)
+        ev_code   uint8[:]   0=SEND 1=RECEIVE 2=other
+        mt_code   uint8[:]   0=GOSSIP 1=other
+        mid_code  int64[:]   interned message ids (index into mids)
+        mids      object[:]  distinct message-id strings
+        port_code int32[:]   row index into ports
+        ports     int64[:]   distinct ports
+        send_ts   int64[:]   sorted SEND timestamps (any msg type)
+
+    Returns None when the directory has no parsable log files.
+    """
+    logs = _scan_logs(log_dir)
+    if not logs:
+        return None
+    if pd is None:
+        return _load_logs_py(logs)
+    frames = [_read_log(path).assign(port=port) for port, path in logs]
+    df = pd.concat(frames, ignore_index=True)
+
+    ev = df["ev"].to_numpy()
+    mt = df["mt"].to_numpy()
+    ev_code = np.where(ev == "SEND", EV_SEND,
+                       np.where(ev == "RECEIVE", EV_RECEIVE, 2)).astype(np.uint8)
+    mt_code = np.where(mt == "GOSSIP", MT_GOSSIP, 1).astype(np.uint8)
+    # Ports come from the file list, not from the rows that parsed: a node
+    # whose log is empty (crashed early) must still count as a cluster
+    # member that never received anything.  _scan_logs returns them sorted,
+    # so searchsorted maps each row back to its file's index.
+    ports = np.fromiter((p for p, _ in logs), np.int64, len(logs))
+    port_code = np.searchsorted(ports, df["port"].to_numpy(np.int64))
+    # Intern message ids: every later comparison is an int compare.
+    mid_code, mids = pd.factorize(df["mid"])
+    ts = df["ts"].to_numpy(np.int64)
+    return {
+        "ts":        ts,
+        "ev_code":   ev_code,
+        "mt_code":   mt_code,
+        "mid_code":  mid_code.astype(np.int64),
+        "mids":      np.asarray(mids),
+        "port_code": port_code.astype(np.int32),
+        "ports":     ports,
+        "send_ts":   np.sort(ts[ev_code == EV_SEND]),
+    }
+
+
+def _load_logs_py(logs):
+    """
+    Pure-Python loader used when pandas is unavailable.  Reads each file
+    in binary mode through a 1 MiB buffer (few read() syscalls, no
+    per-line Unicode decode — int() accepts ASCII bytes directly) and
+    builds the same run record as _load_dir.
+
+    Rows are accumulated in typed buffers (array.array / bytearray), not
+    lists of boxed objects: ~8 bytes per timestamp instead of a PyLong
+    plus list slot, and NumPy can adopt the buffers without copying.
+    """
+    ts        = array.array("q")
+    ev_code   = bytearray()
+    mt_code   = bytearray()
+    mid_code  = array.array("q")
+    port_code = array.array("i")
+    mid_intern = {}
+    # Like the pandas path, every log file is a cluster member — even one
+    # that parses to zero rows (a crashed node never received anything).
+    ports = [port for port, _ in logs]
+    for pidx, (_, path) in enumerate(logs):
+        with open(path, "rb", buffering=1 << 20) as fh:
+            for line in fh:
+                parts = line.strip().split(b",", 3)
+                if len(parts) != 4:
+                    continue
+                try:
+                    t = int(parts[0])
+                except ValueError:
+                    continue
+                ts.append(t)
+                ev_code.append(EV_SEND if parts[1] == b"SEND"
+                               else EV_RECEIVE if parts[1] == b"RECEIVE"
+                               else 2)
+                mt_code.append(MT_GOSSIP if parts[2] == b"GOSSIP" else 1)
+                mid = parts[3]
+                code = mid_intern.get(mid)
+                if code is None:
+                    code = mid_intern[mid] = len(mid_intern)
+                mid_code.append(code)
+                port_code.append(pidx)
+    ts = np.frombuffer(ts, np.int64)
+    ev_code = np.frombuffer(ev_code, np.uint8)
+    return {
+        "ts":        ts,
+        "ev_code":   ev_code,
+        "mt_code":   np.frombuffer(mt_code, np.uint8),
+        "mid_code":  np.frombuffer(mid_code, np.int64),
+        "mids":      np.array([m.decode() for m in mid_intern], dtype=object),
+        "port_code": np.frombuffer(port_code, np.int32),
+        "ports":     np.asarray(ports, np.int64),
+        "send_ts":   np.sort(ts[ev_code == EV_SEND]),
+    }
+
+
+def _find_injector(run):
+    """
+    Return (injector_port, mid_code, origin_ts), where mid_code is the
+    interned id of the injected message.
 
     The injector is the node with the globally earliest SEND,GOSSIP
     timestamp.  Ties are broken by picking the highest port number
     (injector is always on a high port like 7xxx while cluster starts
     at 5000).
     """
-    best = None   # (ts, port, msg_id)
-    for port, rows in per_node.items():
-        for ts, ev, mt, mid in rows:
-            if ev == "SEND" and mt == "GOSSIP":
-                if (best is None
-                        or ts < best[0]
-                        or (ts == best[0] and port > best[1])):
-                    best = (ts, port, mid)
-                break   # earliest SEND per file is enough for comparison
-    if best is None:
+    sends = (run["ev_code"] == EV_SEND) & (run["mt_code"] == MT_GOSSIP)
+    if not sends.any():
         return None, None, None
-    return best[1], best[2], best[0]
+    ts = run["ts"]
+    origin_ts = int(ts[sends].min())
+    at = np.flatnonzero(sends & (ts == origin_ts))
+    ports_at = run["ports"][run["port_code"][at]]
+    winner = at[int(np.argmax(ports_at))]
+    return int(ports_at.max()), int(run["mid_code"][winner]), origin_ts
+
+
+# ── hot scans ────────────────────────────────────────────────────────────────
+
+
+def _first_receives(ts, ev_code, mt_code, mid_code, port_code,
+                    n_ports, target_mid, skip_port):
+    """
+    Earliest RECEIVE,GOSSIP ts of target_mid for every port except
+    skip_port (the injector).  Works in one preallocated n_ports buffer:
+    filled by port index, then compacted in place — no boolean
+    temporaries, no growing list.
+    """
+    first = np.full(n_ports, -1, np.int64)
+    for i in range(ts.shape[0]):
+        if (ev_code[i] == EV_RECEIVE and mt_code[i] == MT_GOSSIP
+                and mid_code[i] == target_mid):
+            p = port_code[i]
+            # rows are time-ordered within a port, so first hit = earliest
+            if first[p] == -1:
+                first[p] = ts[i]
+    k = 0
+    for p in range(n_ports):
+        if p != skip_port and first[p] != -1:
+            first[k] = first[p]
+            k += 1
+    return first[:k]
+
+
+if njit is not None:
+    _first_receives = njit(cache=True)(_first_receives)
+
+
+CACHE_NAME = ".analysis.pkl"
+
+
+def _signature(log_dir, declared_n):
+    """Cache key: declared N plus (name, size, mtime) of every log file."""
+    return (declared_n, tuple(
+        (port, st.st_size, st.st_mtime_ns)
+        for port, p in _scan_logs(log_dir)
+        for st in (os.stat(p),)
+    ))
 
 
 def analyze_run(log_dir, declared_n):
@@ -85,27 +317,51 @@ def analyze_run(log_dir, declared_n):
         total_sent      – total SEND events origin..convergence, or None
         coverage        – fraction of cluster nodes that got the message
     or None if the directory has no log files.
+
+    Results are cached in <log_dir>/.analysis.pkl keyed on the log files'
+    sizes and mtimes, so unchanged directories are never re-parsed.
     """
-    per_node = _load_dir(log_dir)
-    if not per_node:
+    sig = _signature(log_dir, declared_n)
+    cache_path = os.path.join(log_dir, CACHE_NAME)
+    try:
+        with open(cache_path, "rb") as fh:
+            cached_sig, cached = pickle.load(fh)
+        if cached_sig == sig:
+            return cached
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+
+    result = _analyze_run(log_dir, declared_n)
+    if result is not None:
+        try:
+            with open(cache_path, "wb") as fh:
+                pickle.dump((sig, result), fh)
+        except OSError:
+            pass
+    return result
+
+
+def _analyze_run(log_dir, declared_n):
+    run = _load_dir(log_dir)
+    if run is None:
         return None
 
-    injector_port, msg_id, origin_ts = _find_injector(per_node)
-    if msg_id is None:
+    injector_port, target_mid, origin_ts = _find_injector(run)
+    if target_mid is None:
         return {"n_nodes": declared_n, "convergence_ms": None,
                 "total_sent": None, "coverage": 0.0}
 
+    ts, ev_code, mt_code = run["ts"], run["ev_code"], run["mt_code"]
+    port_code, ports = run["port_code"], run["ports"]
+
     # Cluster = everything that is NOT the injector
-    cluster_ports = [p for p in per_node if p != injector_port]
-    n_nodes = len(cluster_ports) if cluster_ports else declared_n
+    inj = np.flatnonzero(ports == injector_port)
+    n_nodes = (len(ports) - inj.size) or declared_n
 
-    # Earliest RECEIVE,GOSSIP timestamp per cluster node for this msg_id
-    receive_times = []
-    for port in cluster_ports:
-        for ts, ev, mt, mid in per_node[port]:
-            if ev == "RECEIVE" and mt == "GOSSIP" and mid == msg_id:
-                receive_times.append(ts)
-                break   # one per node
+    # Earliest RECEIVE,GOSSIP timestamp per cluster node for this message
+    receive_times = _first_receives(ts, ev_code, mt_code, run["mid_code"],
+                                    port_code, len(ports), target_mid,
+                                    int(inj[0]) if inj.size else -1)
 
     coverage = len(receive_times) / n_nodes
 
@@ -114,17 +370,16 @@ def analyze_run(log_dir, declared_n):
         return {"n_nodes": n_nodes, "convergence_ms": None,
                 "total_sent": None, "coverage": coverage}
 
-    receive_times.sort()
-    conv_ts = receive_times[target_count - 1]
+    # O(N) introselect for the one order statistic we need; no full sort
+    conv_ts = int(np.partition(receive_times, target_count - 1)
+                  [target_count - 1])
     conv_ms = conv_ts - origin_ts
 
-    # Overhead = every SEND (any type) across all logs in [origin_ts, conv_ts]
-    total_sent = sum(
-        1
-        for rows in per_node.values()
-        for ts, ev, _, _ in rows
-        if ev == "SEND" and origin_ts <= ts <= conv_ts
-    )
+    # Overhead = every SEND (any type) across all logs in [origin_ts, conv_ts].
+    # Binary search on the sorted SEND timestamps instead of a linear scan.
+    send_ts = run["send_ts"]
+    total_sent = int(np.searchsorted(send_ts, conv_ts, "right")
+                     - np.searchsorted(send_ts, origin_ts, "left"))
 
     return {"n_nodes": n_nodes, "convergence_ms": conv_ms,
             "total_sent": total_sent, "coverage": coverage}
@@ -132,6 +387,29 @@ def analyze_run(log_dir, declared_n):
 
 # ── discovery ────────────────────────────────────────────────────────────────
 
+def _walk(results_dir):
+    """
+    One top-down pass over  results_dir/<mode>/N<k>/seed*  yielding
+    (mode, N, [seed_dirs]) — modes and N values come from the tree
+    itself, so nothing is globbed for combinations that do not exist.
+    """
+    with os.scandir(results_dir) as it:
+        modes = sorted(e.name for e in it if e.is_dir())
+    for mode in modes:
+        sizes = []
+        with os.scandir(os.path.join(results_dir, mode)) as it:
+            for e in it:
+                if e.name.startswith("N") and e.is_dir():
+                    try:
+                        sizes.append((int(e.name[1:]), e.path))
+                    except ValueError:
+                        pass
+        for N, n_dir in sorted(sizes):
+            with os.scandir(n_dir) as it:
+                yield mode, N, sorted(e.path for e in it
+                                      if e.name.startswith("seed"))
+
+
 def collect_results(results_dir=RESULTS_DIR):
     """
     Walk results_dir and return  data[mode][N] = [run_dict, ...]
@@ -141,45 +419,65 @@ def collect_results(results_dir=RESULTS_DIR):
         print(f"[!] '{results_dir}' not found – run experiment.sh first.")
         return {}
 
-    modes = sorted(
-        d for d in os.listdir(results_dir)
-        if os.path.isdir(os.path.join(results_dir, d))
-    )
-    if not modes:
+    # Build the full task list first; every seed dir is independent.
+    tasks = []   # (mode, N, seed_dir)
+    data = {}
+    for mode, N, seed_dirs in _walk(results_dir):
+        data.setdefault(mode, {})[N] = []
+        for sd in seed_dirs:
+            tasks.append((mode, N, sd))
+
+    if not data:
         print(f"[!] No subdirectories in '{results_dir}'.")
         return {}
 
-    data = {}
-    for mode in modes:
-        data[mode] = {}
-        mode_dir = os.path.join(results_dir, mode)
-        # Discover N values
-        sizes = []
-        for d in os.listdir(mode_dir):
-            if d.startswith("N"):
-                try:
-                    sizes.append(int(d[1:]))
-                except ValueError:
-                    pass
-        for N in sorted(sizes):
-            seed_dirs = sorted(glob.glob(
-                os.path.join(mode_dir, f"N{N}", "seed*")))
-            runs = []
-            for sd in seed_dirs:
-                result = analyze_run(sd, N)
-                if result is None:
-                    print(f"  [warn] no logs in {sd}")
-                    continue
-                result["seed"] = os.path.basename(sd)
-                runs.append(result)
-            data[mode][N] = runs
+    # One process per core; seeds are CPU+I/O independent.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        results = pool.map(analyze_run,
+                           [sd for _, _, sd in tasks],
+                           [N for _, N, _ in tasks])
+
+    for (mode, N, sd), result in zip(tasks, results):
+        if result is None:
+            print(f"  [warn] no logs in {sd}")
+            continue
+        result["seed"] = os.path.basename(sd)
+        data[mode][N].append(result)
 
     return data
 
 
 # ── reporting ─────────────────────────────────────────────────────────────────
 
-def print_table(data):
+# One aggregate row per (mode, N); NaN marks "no data" for a column.
+AGG_DTYPE = np.dtype([("N", "i4"), ("runs", "i4"),
+                      ("conv_mean", "f8"), ("conv_std", "f8"),
+                      ("sent_mean", "f8"), ("sent_std", "f8"),
+                      ("cov_mean", "f8")])
+
+
+def _aggregate(data):
+    """Reduce data[mode][N] once into  agg[mode] = structured array."""
+    agg = {}
+    for mode in sorted(data):
+        rows = np.zeros(len(data[mode]), dtype=AGG_DTYPE)
+        for i, N in enumerate(sorted(data[mode])):
+            runs = data[mode][N]
+            # None -> NaN so each column aggregates in one C pass
+            cv = np.array([np.nan if r["convergence_ms"] is None
+                           else r["convergence_ms"] for r in runs], float)
+            ov = np.array([np.nan if r["total_sent"] is None
+                           else r["total_sent"] for r in runs], float)
+            covv = np.array([r["coverage"] for r in runs], float)
+            rows[i] = ((N, len(runs))
+                       + _nan_mean_std(cv)
+                       + _nan_mean_std(ov)
+                       + (_nan_mean_std(covv)[0],))
+        agg[mode] = rows
+    return agg
+
+
+def print_table(data, agg):
     if not data:
         return
     sep = "─" * 80
@@ -191,26 +489,25 @@ def print_table(data):
           f"{'Avg cov':>8}")
     print(sep)
 
+    isnan = math.isnan
+
+    def f(v):
+        return f"{v:>10.1f}" if not isnan(v) else "       n/a"
+
     for mode in sorted(data):
         first_row = True
-        for N in sorted(data[mode]):
-            runs = data[mode][N]
-            cv = [r["convergence_ms"] for r in runs if r["convergence_ms"] is not None]
-            ov = [r["total_sent"]     for r in runs if r["total_sent"]     is not None]
-            covv = [r["coverage"]     for r in runs]
-
-            def f(v):
-                return f"{v:>10.1f}" if not math.isnan(v) else "       n/a"
+        for row in agg[mode]:
+            N = int(row["N"])
 
             mode_col = mode if first_row else ""
             first_row = False
-            print(f"{mode_col:<14} {N:>4}  {len(runs):>4}  "
-                  f"{f(_mean(cv))} {f(_std(cv))}  "
-                  f"{f(_mean(ov))} {f(_std(ov))}  "
-                  f"{_mean(covv)*100:>7.1f}%")
+            print(f"{mode_col:<14} {N:>4}  {row['runs']:>4}  "
+                  f"{f(row['conv_mean'])} {f(row['conv_std'])}  "
+                  f"{f(row['sent_mean'])} {f(row['sent_std'])}  "
+                  f"{row['cov_mean']*100:>7.1f}%")
 
             # Flag any seed that didn't converge
-            for r in runs:
+            for r in data[mode][N]:
                 if r["convergence_ms"] is None:
                     pct = r["coverage"] * 100
                     print(f"    [{r['seed']}]  did not reach "
@@ -247,7 +544,7 @@ def print_comparison(data):
     print()
 
 
-def make_plots(data):
+def make_plots(agg):
     try:
         import matplotlib
         matplotlib.use("Agg")
@@ -255,37 +552,30 @@ def make_plots(data):
     except ImportError:
         print("[!] matplotlib not installed – skipping plots.")
         return
-    if not data:
+    if not agg:
         return
 
     palette    = ["#e74c3c", "#2980b9", "#27ae60", "#8e44ad"]
     markers    = ["o", "s", "^", "D"]
     label_map  = {"push_only": "Push-only", "hybrid": "Hybrid Push-Pull"}
-    all_modes  = sorted(data.keys())
+    all_modes  = sorted(agg)
     cmap       = {m: palette[i % len(palette)] for i, m in enumerate(all_modes)}
     mmap       = {m: markers[i % len(markers)] for i, m in enumerate(all_modes)}
 
     fig, (ax0, ax1) = plt.subplots(1, 2, figsize=(14, 5))
 
     for mode in all_modes:
-        ns, cm, cs, om, os_ = [], [], [], [], []
-        for N in sorted(data[mode]):
-            cv = [r["convergence_ms"] for r in data[mode][N]
-                  if r["convergence_ms"] is not None]
-            ov = [r["total_sent"]     for r in data[mode][N]
-                  if r["total_sent"]  is not None]
-            if cv:
-                ns.append(N)
-                cm.append(_mean(cv));  cs.append(_std(cv))
-                om.append(_mean(ov) if ov else float("nan"))
-                os_.append(_std(ov) if len(ov) > 1 else 0.0)
-
+        # Keep only the sizes with at least one converged run; the
+        # aggregate arrays go to errorbar() as-is, no list rebuilds.
+        rows = agg[mode][~np.isnan(agg[mode]["conv_mean"])]
         lbl = label_map.get(mode, mode)
         kw  = dict(color=cmap[mode], marker=mmap[mode],
                    capsize=4, linewidth=2, label=lbl)
-        if ns:
-            ax0.errorbar(ns, cm, yerr=cs,  **kw)
-            ax1.errorbar(ns, om, yerr=os_, **kw)
+        if rows.size:
+            ax0.errorbar(rows["N"], rows["conv_mean"],
+                         yerr=rows["conv_std"], **kw)
+            ax1.errorbar(rows["N"], rows["sent_mean"],
+                         yerr=rows["sent_std"], **kw)
 
     for ax, title, ylabel in [
         (ax0, "95% Convergence Time vs N", "Convergence time (ms)"),
@@ -297,7 +587,7 @@ def make_plots(data):
         ax.legend()
         ax.grid(True, alpha=0.3)
         # Only set fixed ticks if we have data for those sizes
-        all_ns = sorted({N for md in data.values() for N in md})
+        all_ns = sorted({int(n) for rows in agg.values() for n in rows["N"]})
         if all_ns:
             ax.set_xticks(all_ns)
 
@@ -311,6 +601,7 @@ def make_plots(data):
 if __name__ == "__main__":
     rdir = sys.argv[1] if len(sys.argv) > 1 else RESULTS_DIR
     data = collect_results(rdir)
-    print_table(data)
+    agg  = _aggregate(data)
+    print_table(data, agg)
     print_comparison(data)
-    make_plots(data)
+    make_plots(agg)
@@ -34,16 +34,40 @@ Usage
 
 import argparse
 import csv
+import hashlib
+import json
+import multiprocessing as mp
 import os
 import re
 import sys
-import statistics
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 try:
     import matplotlib
     matplotlib.use("Agg")
+    matplotlib.rcParams["path.simplify_threshold"] = 1.0
+    matplotlib.rcParams["agg.path.chunksize"] = 10000
     import matplotlib.pyplot as plt
     import matplotlib.ticker as ticker
     HAS_PLOT = True
@@ -58,59 +82,338 @@ except ImportError:
 
 CONVERGENCE_THRESHOLD = 0.95   # 95 % of nodes must receive the message
 GOSSIP_TYPE           = "GOSSIP"
-CONTROL_TYPES         = {"HELLO", "GET_PEERS", "PEERS_LIST", "PING", "PONG",
-                         "IHAVE", "IWANT"}
+CONTROL_TYPES         = frozenset({"HELLO", "GET_PEERS", "PEERS_LIST",
+                                   "PING", "PONG", "IHAVE", "IWANT"})
+
+# Columnar event layout: one structured record per log line.
+EVENT_DTYPE     = np.dtype([("ts", "i8"), ("event", "S8"),
+                            ("mtype", "S12"), ("mid", "S64")])
+LOG_COLUMNS     = ["ts", "event", "mtype", "mid"]
+
+# Per-trial parse cache (Parquet sidecar, see load_trial)
+CACHE_NAME      = ".cache.parquet"
+CACHE_SIG_KEY   = b"log_signature"
+GOSSIP_TYPE_B   = GOSSIP_TYPE.encode()
+CONTROL_TYPES_B = np.array(sorted(CONTROL_TYPES), dtype="S12")
 
 COLORS = {
     "push":   "#4C72B0",
     "hybrid": "#DD8452",
 }
 
+PLOT_NAMES = ("convergence.png", "overhead.png", "delivery_rate.png",
+              "combined.png", "scatter.png", "convergence_line.png")
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Log parsing
 # ─────────────────────────────────────────────────────────────────────────────
 
-def parse_log(log_path: Path) -> list[dict]:
+def _scan_logs(trial_dir: Path) -> list[Path]:
+    """node_<port>.log files in trial_dir, sorted by port number."""
+    found = []
+    try:
+        it = os.scandir(trial_dir)
+    except OSError:
+        return []
+    with it:
+        for de in it:
+            name = de.name
+            if name.startswith("node_") and name.endswith(".log"):
+                try:
+                    found.append((int(name[5:-4]), Path(de.path)))
+                except ValueError:
+                    continue
+    found.sort()
+    return [path for _, path in found]
+
+
+def parse_log(log_path: Path) -> list[tuple]:
     """
-    Parse a single node log file.
-    Returns a list of event dicts: {ts, event, msg_type, msg_id}
+    Parse a single node log file by scanning its raw bytes.
+    Returns a list of event tuples: (ts, event, msg_type, msg_id); the
+    three name fields stay as bytes — load_trial packs them into 'S'
+    columns without a decode round-trip.
     """
+    return _parse_bytes(log_path.read_bytes())
+
+
+def _parse_bytes(data: bytes) -> list[tuple]:
     events = []
-    with open(log_path) as f:
-        for lineno, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split(",", 3)
-            if len(parts) != 4:
-                continue
-            ts_str, event, msg_type, msg_id = parts
+    append = events.append
+    start, end = 0, len(data)
+    while start < end:
+        nl = data.find(b"\n", start)
+        if nl == -1:
+            nl = end
+        c1 = data.find(b",", start, nl)
+        c2 = data.find(b",", c1 + 1, nl) if c1 != -1 else -1
+        c3 = data.find(b",", c2 + 1, nl) if c2 != -1 else -1
+        if c3 != -1:
             try:
-                events.append({
-                    "ts":       int(ts_str),
-                    "event":    event.strip(),
-                    "msg_type": msg_type.strip(),
-                    "msg_id":   msg_id.strip(),
-                })
+                append((int(data[start:c1]), data[c1 + 1:c2],
+                        data[c2 + 1:c3], data[c3 + 1:nl].rstrip(b"\r")))
             except ValueError:
-                continue
+                pass
+        start = nl + 1
     return events
 
 
-def load_trial(trial_dir: Path) -> list[dict]:
-    """Load all log files in a trial directory."""
+def _load_trial_py(files: list[Path]) -> np.ndarray:
+    """Pure-Python loader used when pandas is not installed."""
+    # Overlap the disk reads (read_bytes releases the GIL), parse serially.
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as ex:
+            blobs = list(ex.map(Path.read_bytes, files))
+    else:
+        blobs = [f.read_bytes() for f in files]
     all_events = []
-    for log_file in sorted(trial_dir.glob("node_*.log")):
-        all_events.extend(parse_log(log_file))
-    return all_events
+    for data in blobs:
+        all_events.extend(_parse_bytes(data))
+    return np.array(all_events, dtype=EVENT_DTYPE)
+
+
+def _trial_signature(files: list[Path]) -> str:
+    """Fingerprint of a trial's log set; any rewrite invalidates the cache."""
+    return ";".join(f"{f.name}:{st.st_size}:{st.st_mtime_ns}"
+                    for f in files for st in (f.stat(),))
+
+
+def _read_cache(cache: Path, sig: str) -> np.ndarray | None:
+    try:
+        table = pq.read_table(cache)
+    except Exception:
+        return None
+    meta = table.schema.metadata or {}
+    if meta.get(CACHE_SIG_KEY) != sig.encode():
+        return None
+    out = np.empty(table.num_rows, dtype=EVENT_DTYPE)
+    for name in EVENT_DTYPE.names:
+        out[name] = table[name].to_numpy(zero_copy_only=False)
+    return out
+
+
+def _write_cache(cache: Path, sig: str, events: np.ndarray) -> None:
+    table = pa.table({name: events[name] for name in EVENT_DTYPE.names})
+    table = table.replace_schema_metadata({CACHE_SIG_KEY: sig.encode()})
+    try:
+        pq.write_table(table, cache)
+    except OSError:
+        pass    # read-only results tree — caching is best-effort
+
+
+def load_trial(trial_dir: Path) -> np.ndarray:
+    """
+    Load all log files in a trial directory into one structured array.
+
+    Parsed events are cached in a Parquet sidecar next to the logs so
+    re-runs (plot/report tweaking) skip the parse entirely; the cache is
+    keyed on the log files' sizes and mtimes.
+    """
+    files = _scan_logs(trial_dir)
+    cache = trial_dir / CACHE_NAME
+    sig   = _trial_signature(files) if pa is not None and files else None
+    if sig is not None and cache.exists():
+        cached = _read_cache(cache, sig)
+        if cached is not None:
+            return cached
+
+    events = _parse_trial(files)
+    if sig is not None:
+        _write_cache(cache, sig, events)
+    return events
+
+
+def _parse_trial(files: list[Path]) -> np.ndarray:
+    """Parse a trial's logs from scratch (pandas C parser when available)."""
+    if pd is None:
+        return _load_trial_py(files)
+
+    frames = []
+    for f in files:
+        try:
+            frames.append(pd.read_csv(
+                f, header=None, names=LOG_COLUMNS, dtype=str,
+                engine="c", on_bad_lines="skip"))
+        except pd.errors.EmptyDataError:
+            continue
+    if not frames:
+        return np.empty(0, dtype=EVENT_DTYPE)
+
+    df   = pd.concat(frames, ignore_index=True)
+    ts   = pd.to_numeric(df["ts"], errors="coerce")
+    good = (ts.notna() & df["event"].notna() & df["mtype"].notna()
+            & df["mid"].notna()).to_numpy()
+
+    out = np.empty(int(good.sum()), dtype=EVENT_DTYPE)
+    out["ts"]    = ts.to_numpy()[good].astype(np.int64)
+    out["event"] = df["event"].to_numpy()[good].astype("S8")
+    out["mtype"] = df["mtype"].to_numpy()[good].astype("S12")
+    out["mid"]   = df["mid"].to_numpy()[good].astype("S64")
+    return out
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Metric computation
 # ─────────────────────────────────────────────────────────────────────────────
 
-def compute_metrics(events: list[dict], n_nodes: int) -> dict:
+_TS_SENTINEL = np.int64(1) << 62
+
+
+def _metrics_kernel(ts, ev_code, mt_code, mid_code, n_mids, target):
+    """
+    Hot loop over int-encoded parallel arrays.  Codes: event SEND=0 /
+    RECEIVE=1, mtype GOSSIP=0 / control=1 / other=2.  Returns
+    (n_received, window_end, inject_ts, gossip_sends, control_sends,
+     overhead_sends, n_gossip_messages); n_received is 0 when the trial
+    has no gossip receives.  JIT-compiled when numba is installed.
+    """
+    n = ts.shape[0]
+
+    # Single fused pass: per-mid receive counts, send tallies, earliest
+    # gossip send per mid, plus compacted send/receive timestamp streams
+    # for the (much smaller) follow-up scans.
+    recv_counts   = np.zeros(n_mids, np.int64)
+    inject_min    = np.full(n_mids, _TS_SENTINEL)
+    send_ts       = np.empty(n, np.int64)
+    recv_ts_all   = np.empty(n, np.int64)
+    recv_mid_all  = np.empty(n, np.int64)
+    n_sends       = 0
+    n_recv        = 0
+    gossip_sends  = np.int64(0)
+    control_sends = np.int64(0)
+    for i in range(n):
+        e = ev_code[i]
+        if e == 0:                               # SEND
+            t = ts[i]
+            send_ts[n_sends] = t
+            n_sends += 1
+            m = mt_code[i]
+            if m == 0:
+                gossip_sends += 1
+                mc = mid_code[i]
+                if t < inject_min[mc]:
+                    inject_min[mc] = t
+            elif m == 1:
+                control_sends += 1
+        elif e == 1 and mt_code[i] == 0:         # gossip RECEIVE
+            mc = mid_code[i]
+            recv_counts[mc] += 1
+            recv_ts_all[n_recv] = ts[i]
+            recv_mid_all[n_recv] = mc
+            n_recv += 1
+
+    # Pick the GOSSIP message with the most receivers
+    n_gossip_msgs = 0
+    best = -1
+    best_count = 0
+    for m in range(n_mids):
+        c = recv_counts[m]
+        if c > 0:
+            n_gossip_msgs += 1
+            if c > best_count:
+                best_count = c
+                best = m
+    if best < 0:
+        return (np.int64(0), np.int64(0), np.int64(0), np.int64(0),
+                np.int64(0), np.int64(0), np.int64(0))
+
+    receive_times = np.empty(best_count, np.int64)
+    k = 0
+    for i in range(n_recv):
+        if recv_mid_all[i] == best:
+            receive_times[k] = recv_ts_all[i]
+            k += 1
+
+    # Injection time = earliest SEND of this msg_id (across any node);
+    # fall back to first receive
+    inject_ts = inject_min[best]
+    if inject_ts == _TS_SENTINEL:
+        inject_ts = receive_times.min()
+
+    # Overhead window end: the target-th receive (or the last one).  Only
+    # this order statistic matters, so select it instead of sorting.
+    if best_count >= target:
+        sel = target - 1
+    else:
+        sel = best_count - 1
+    window_end = np.partition(receive_times, sel)[sel]
+    sends = send_ts[:n_sends]
+    sends.sort()
+    overhead_sends = (np.searchsorted(sends, window_end, side="right")
+                      - np.searchsorted(sends, inject_ts, side="left"))
+
+    return (np.int64(best_count), window_end, inject_ts, gossip_sends,
+            control_sends, overhead_sends, np.int64(n_gossip_msgs))
+
+
+if njit is not None:
+    _metrics_kernel = njit(cache=True)(_metrics_kernel)
+
+
+def _encode_events(events: np.ndarray):
+    """Map event/mtype/mid strings to the small-int codes the kernel uses."""
+    ev_code = np.where(events["event"] == b"SEND", 0,
+                       np.where(events["event"] == b"RECEIVE", 1, 2)
+                       ).astype(np.uint8)
+    gossip_rows = events["mtype"] == GOSSIP_TYPE_B
+    mt_code = np.where(gossip_rows, 0,
+                       np.where(np.isin(events["mtype"], CONTROL_TYPES_B),
+                                1, 2)).astype(np.uint8)
+    # Only gossip rows carry msg ids the kernel cares about; control ids
+    # (ctrl_*) are unique per message and would blow up the code table.
+    mid_code = np.full(len(events), -1, np.int64)
+    mids, codes = np.unique(events["mid"][gossip_rows], return_inverse=True)
+    mid_code[gossip_rows] = codes
+    return ev_code, mt_code, mid_code, len(mids)
+
+
+def _metrics_masks(events: np.ndarray, target: int):
+    """Boolean-mask equivalent of _metrics_kernel for numba-less installs."""
+    ts, ev, mt, mid = (events["ts"], events["event"],
+                       events["mtype"], events["mid"])
+
+    send_mask        = ev == b"SEND"
+    gossip_mask      = mt == GOSSIP_TYPE_B
+    gossip_recv_mask = (ev == b"RECEIVE") & gossip_mask
+    gossip_send_mask = send_mask & gossip_mask
+
+    if not gossip_recv_mask.any():
+        return 0, 0, 0, 0, 0, 0, 0
+
+    # Pick the GOSSIP message with the most receivers
+    ids, counts = np.unique(mid[gossip_recv_mask], return_counts=True)
+    best_id     = ids[counts.argmax()]
+    best_mask   = mid == best_id
+
+    receive_times = ts[gossip_recv_mask & best_mask]
+    n_received    = int(receive_times.size)
+
+    # Injection time = earliest SEND of this msg_id (across any node)
+    inject_times = ts[gossip_send_mask & best_mask]
+    if inject_times.size == 0:
+        # fall back to first receive
+        inject_ts = receive_times.min()
+    else:
+        inject_ts = inject_times.min()
+
+    gossip_sends  = int(np.count_nonzero(gossip_send_mask))
+    control_sends = int(np.count_nonzero(
+        send_mask & np.isin(mt, CONTROL_TYPES_B)))
+
+    # Overhead window end: the target-th receive (or the last one) —
+    # a single order statistic, selected rather than sorted for.
+    sel = target - 1 if n_received >= target else n_received - 1
+    window_end = np.partition(receive_times, sel)[sel]
+    send_times = np.sort(ts[send_mask])
+    overhead_sends = int(np.searchsorted(send_times, window_end, side="right")
+                         - np.searchsorted(send_times, inject_ts, side="left"))
+
+    return (n_received, window_end, inject_ts, gossip_sends, control_sends,
+            overhead_sends, len(ids))
+
+
+def compute_metrics(events: np.ndarray, n_nodes: int) -> dict:
     """
     Given all events from one trial, return:
       - convergence_ms    : ms to reach CONVERGENCE_THRESHOLD coverage (or None)
@@ -121,58 +424,36 @@ def compute_metrics(events: list[dict], n_nodes: int) -> dict:
       - overhead_sends    : total_sends from injection time to convergence time
       - n_gossip_messages : number of distinct gossip msg_ids
     """
-    if not events:
+    if events.size == 0:
         return _empty_metrics()
 
-    # ── Separate GOSSIP RECEIVE events grouped by msg_id ────────────────────
-    gossip_receives: dict[str, list[int]] = defaultdict(list)  # msg_id -> [ts]
-    gossip_sends_ts: dict[str, list[int]] = defaultdict(list)
-    all_sends: list[dict] = []
+    target = max(1, int(CONVERGENCE_THRESHOLD * n_nodes))
 
-    for e in events:
-        if e["event"] == "SEND":
-            all_sends.append(e)
-            if e["msg_type"] == GOSSIP_TYPE:
-                gossip_sends_ts[e["msg_id"]].append(e["ts"])
-        elif e["event"] == "RECEIVE" and e["msg_type"] == GOSSIP_TYPE:
-            gossip_receives[e["msg_id"]].append(e["ts"])
+    if njit is not None:
+        ev_code, mt_code, mid_code, n_mids = _encode_events(events)
+        (n_received, window_end, inject_ts, gossip_sends, control_sends,
+         overhead_sends, n_gossip_msgs) = _metrics_kernel(
+            np.ascontiguousarray(events["ts"]), ev_code, mt_code,
+            mid_code, n_mids, target)
+    else:
+        (n_received, window_end, inject_ts, gossip_sends, control_sends,
+         overhead_sends, n_gossip_msgs) = _metrics_masks(events, target)
 
-    if not gossip_receives:
+    if n_received == 0:
         return _empty_metrics()
 
-    # Pick the GOSSIP message with the most receivers
-    best_id = max(gossip_receives, key=lambda k: len(gossip_receives[k]))
-    receive_times = sorted(gossip_receives[best_id])
-    n_received    = len(receive_times)
+    n_received    = int(n_received)
     delivery_rate = n_received / n_nodes
 
-    # Injection time = earliest SEND of this msg_id (across any node)
-    inject_times  = gossip_sends_ts.get(best_id, [])
-    if not inject_times:
-        # fall back to first receive
-        inject_ts = receive_times[0]
-    else:
-        inject_ts = min(inject_times)
-
-    # Convergence time
-    target       = max(1, int(CONVERGENCE_THRESHOLD * n_nodes))
+    # Convergence time (window_end is the target-th receive timestamp)
     convergence_ms = None
-    if len(receive_times) >= target:
-        convergence_ts = receive_times[target - 1]
-        convergence_ms = convergence_ts - inject_ts
-
-    # Total message counts during experiment window
-    gossip_sends   = sum(1 for e in all_sends if e["msg_type"] == GOSSIP_TYPE)
-    control_sends  = sum(1 for e in all_sends if e["msg_type"] in CONTROL_TYPES)
-    total_sends    = gossip_sends + control_sends
-
-    # Overhead: sends strictly between inject_ts and convergence (or end)
-    window_end = receive_times[target - 1] if convergence_ms is not None \
-                 else (receive_times[-1] if receive_times else inject_ts)
-    overhead_sends = sum(
-        1 for e in all_sends
-        if inject_ts <= e["ts"] <= window_end
-    )
+    if n_received >= target:
+        convergence_ms = int(window_end - inject_ts)
+
+    gossip_sends  = int(gossip_sends)
+    control_sends = int(control_sends)
+    total_sends   = gossip_sends + control_sends
+    overhead_sends = int(overhead_sends)
 
     return {
         "convergence_ms":    convergence_ms,
@@ -182,10 +463,33 @@ def compute_metrics(events: list[dict], n_nodes: int) -> dict:
         "total_sends":       total_sends,
         "overhead_sends":    overhead_sends,
         "n_receivers":       n_received,
-        "n_gossip_messages": len(gossip_receives),
+        "n_gossip_messages": int(n_gossip_msgs),
     }
 
 
+@dataclass(slots=True)
+class TrialResult:
+    """One analyzed trial: identity plus the compute_metrics output."""
+    mode: str
+    n: int
+    seed: int
+    convergence_ms: int | None
+    delivery_rate: float
+    gossip_sends: int
+    control_sends: int
+    total_sends: int
+    overhead_sends: int
+    n_receivers: int
+    n_gossip_messages: int
+
+
+def _process_trial(trial: dict) -> TrialResult:
+    """Worker: load one trial's logs and compute its metrics."""
+    events = load_trial(trial["path"])
+    m = compute_metrics(events, trial["n"])
+    return TrialResult(trial["mode"], trial["n"], trial["seed"], **m)
+
+
 def _empty_metrics() -> dict:
     return {
         "convergence_ms":    None,
@@ -215,10 +519,11 @@ def discover_trials(results_dir: Path) -> list[dict]:
     Return a list of trial metadata dicts.
     """
     trials = []
+    match  = TRIAL_RE.match
     for d in sorted(results_dir.iterdir()):
         if not d.is_dir():
             continue
-        m = TRIAL_RE.match(d.name)
+        m = match(d.name)
         if not m:
             continue
         trials.append({
@@ -236,24 +541,24 @@ def discover_trials(results_dir: Path) -> list[dict]:
 
 def safe_mean(vals):
     valid = [v for v in vals if v is not None]
-    return statistics.mean(valid) if valid else None
+    return float(np.mean(valid)) if valid else None
 
 def safe_std(vals):
     valid = [v for v in vals if v is not None]
-    return statistics.stdev(valid) if len(valid) > 1 else 0.0
+    return float(np.std(valid, ddof=1)) if len(valid) > 1 else 0.0
 
-def aggregate(per_trial: list[dict]) -> dict:
+def aggregate(per_trial: list[TrialResult]) -> dict:
     """Aggregate per-trial rows that share (mode, n)."""
-    grouped: dict[tuple, list[dict]] = defaultdict(list)
+    grouped: dict[tuple, list[TrialResult]] = defaultdict(list)
     for row in per_trial:
-        grouped[(row["mode"], row["n"])].append(row)
+        grouped[(row.mode, row.n)].append(row)
 
     summary = []
     for (mode, n), rows in sorted(grouped.items()):
-        conv_vals  = [r["convergence_ms"]  for r in rows]
-        ovhd_vals  = [r["overhead_sends"]  for r in rows]
-        drate_vals = [r["delivery_rate"]   for r in rows]
-        total_vals = [r["total_sends"]     for r in rows]
+        conv_vals  = [r.convergence_ms  for r in rows]
+        ovhd_vals  = [r.overhead_sends  for r in rows]
+        drate_vals = [r.delivery_rate   for r in rows]
+        total_vals = [r.total_sends     for r in rows]
 
         summary.append({
             "mode":              mode,
@@ -275,7 +580,7 @@ def aggregate(per_trial: list[dict]) -> dict:
 # CSV output
 # ─────────────────────────────────────────────────────────────────────────────
 
-def save_per_trial_csv(rows: list[dict], path: str) -> None:
+def save_per_trial_csv(rows: list[TrialResult], path: str) -> None:
     fields = [
         "mode", "n", "seed",
         "convergence_ms", "delivery_rate",
@@ -283,10 +588,10 @@ def save_per_trial_csv(rows: list[dict], path: str) -> None:
         "total_sends", "overhead_sends",
         "n_receivers", "n_gossip_messages",
     ]
-    with open(path, "w", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
-        w.writeheader()
-        w.writerows(rows)
+    with open(path, "w", newline="", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(fields)
+        w.writerows([getattr(r, k) for k in fields] for r in rows)
     print(f"[INFO] Per-trial CSV  → {path}")
 
 
@@ -298,10 +603,10 @@ def save_summary_csv(rows: list[dict], path: str) -> None:
         "mean_delivery_rate", "std_delivery_rate",
         "mean_total_sends", "std_total_sends",
     ]
-    with open(path, "w", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
-        w.writeheader()
-        w.writerows(rows)
+    with open(path, "w", newline="", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(fields)
+        w.writerows([r.get(k) for k in fields] for r in rows)
     print(f"[INFO] Summary CSV    → {path}")
 
 
@@ -309,6 +614,31 @@ def save_summary_csv(rows: list[dict], path: str) -> None:
 # Plots
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _plots_up_to_date(out_dir: Path, sig: str) -> bool:
+    """True when every PNG exists and the data hash matches the sidecar."""
+    try:
+        if (out_dir / ".sig").read_text() != sig:
+            return False
+    except OSError:
+        return False
+    return all((out_dir / name).exists() for name in PLOT_NAMES)
+
+
+# One Figure reused across all charts: creating a fresh Figure+Axes per
+# plot costs tens of ms, and clf() is much cheaper.
+_FIG = None
+
+
+def _get_fig(figsize):
+    global _FIG
+    if _FIG is None:
+        _FIG = plt.figure(figsize=figsize)
+    else:
+        _FIG.clf()
+        _FIG.set_size_inches(*figsize)
+    return _FIG
+
+
 def _grouped_bar(ax, ns, push_vals, push_errs, hybrid_vals, hybrid_errs,
                  ylabel, title):
     """Draw a grouped bar chart with Push vs Hybrid."""
@@ -339,80 +669,91 @@ def _grouped_bar(ax, ns, push_vals, push_errs, hybrid_vals, hybrid_errs,
     ax.set_axisbelow(True)
 
     # Annotate bar tops
+    all_vals = push_vals + hybrid_vals
+    offset   = max(all_vals) * 0.01 if all_vals else 0.0
+    text     = ax.text
     for bar in list(bars_p) + list(bars_h):
         h = bar.get_height()
         if h and not (h != h):   # nan check
             label = f"{h:.0f}" if h >= 10 else f"{h:.1f}"
-            ax.text(
+            text(
                 bar.get_x() + bar.get_width() / 2,
-                h + max(push_vals + hybrid_vals) * 0.01,
+                h + offset,
                 label,
                 ha="center", va="bottom", fontsize=8,
             )
 
 
-def _lookup(summary, mode, n, key):
-    for row in summary:
-        if row["mode"] == mode and row["n"] == n:
-            v = row.get(key)
-            return float(v) if v is not None else 0.0
-    return 0.0
+def _summary_index(summary) -> dict:
+    """Index summary rows by (mode, n) so plot assembly avoids linear scans."""
+    return {(r["mode"], r["n"]): r for r in summary}
+
+
+def _lookup(summary_idx, mode, n, key):
+    row = summary_idx.get((mode, n))
+    if row is None:
+        return 0.0
+    v = row.get(key)
+    return float(v) if v is not None else 0.0
 
 
 def plot_convergence(summary, ns, out_dir):
     if not HAS_PLOT:
         return
-    fig, ax = plt.subplots(figsize=(8, 5))
-    push_means = [_lookup(summary, "push",   n, "mean_convergence_ms") for n in ns]
-    push_errs  = [_lookup(summary, "push",   n, "std_convergence_ms")  for n in ns]
-    hyb_means  = [_lookup(summary, "hybrid", n, "mean_convergence_ms") for n in ns]
-    hyb_errs   = [_lookup(summary, "hybrid", n, "std_convergence_ms")  for n in ns]
+    idx = _summary_index(summary)
+    fig = _get_fig((8, 5))
+    ax  = fig.add_subplot(111)
+    push_means = [_lookup(idx, "push",   n, "mean_convergence_ms") for n in ns]
+    push_errs  = [_lookup(idx, "push",   n, "std_convergence_ms")  for n in ns]
+    hyb_means  = [_lookup(idx, "hybrid", n, "mean_convergence_ms") for n in ns]
+    hyb_errs   = [_lookup(idx, "hybrid", n, "std_convergence_ms")  for n in ns]
     _grouped_bar(ax, ns, push_means, push_errs, hyb_means, hyb_errs,
                  "Convergence time (ms)",
                  "Time to 95% Coverage — Push-only vs Hybrid")
-    plt.tight_layout()
+    fig.tight_layout()
     path = os.path.join(out_dir, "convergence.png")
-    plt.savefig(path, dpi=150, bbox_inches="tight")
-    plt.close()
+    fig.savefig(path, dpi=150)
     print(f"[INFO] Plot saved     → {path}")
 
 
 def plot_overhead(summary, ns, out_dir):
     if not HAS_PLOT:
         return
-    fig, ax = plt.subplots(figsize=(8, 5))
-    push_means = [_lookup(summary, "push",   n, "mean_overhead_sends") for n in ns]
-    push_errs  = [_lookup(summary, "push",   n, "std_overhead_sends")  for n in ns]
-    hyb_means  = [_lookup(summary, "hybrid", n, "mean_overhead_sends") for n in ns]
-    hyb_errs   = [_lookup(summary, "hybrid", n, "std_overhead_sends")  for n in ns]
+    idx = _summary_index(summary)
+    fig = _get_fig((8, 5))
+    ax  = fig.add_subplot(111)
+    push_means = [_lookup(idx, "push",   n, "mean_overhead_sends") for n in ns]
+    push_errs  = [_lookup(idx, "push",   n, "std_overhead_sends")  for n in ns]
+    hyb_means  = [_lookup(idx, "hybrid", n, "mean_overhead_sends") for n in ns]
+    hyb_errs   = [_lookup(idx, "hybrid", n, "std_overhead_sends")  for n in ns]
     _grouped_bar(ax, ns, push_means, push_errs, hyb_means, hyb_errs,
                  "Total message sends",
                  "Message Overhead — Push-only vs Hybrid")
-    plt.tight_layout()
+    fig.tight_layout()
     path = os.path.join(out_dir, "overhead.png")
-    plt.savefig(path, dpi=150, bbox_inches="tight")
-    plt.close()
+    fig.savefig(path, dpi=150)
     print(f"[INFO] Plot saved     → {path}")
 
 
 def plot_delivery_rate(summary, ns, out_dir):
     if not HAS_PLOT:
         return
-    fig, ax = plt.subplots(figsize=(8, 5))
-    push_means = [_lookup(summary, "push",   n, "mean_delivery_rate") * 100 for n in ns]
-    push_errs  = [_lookup(summary, "push",   n, "std_delivery_rate")  * 100 for n in ns]
-    hyb_means  = [_lookup(summary, "hybrid", n, "mean_delivery_rate") * 100 for n in ns]
-    hyb_errs   = [_lookup(summary, "hybrid", n, "std_delivery_rate")  * 100 for n in ns]
+    idx = _summary_index(summary)
+    fig = _get_fig((8, 5))
+    ax  = fig.add_subplot(111)
+    push_means = [_lookup(idx, "push",   n, "mean_delivery_rate") * 100 for n in ns]
+    push_errs  = [_lookup(idx, "push",   n, "std_delivery_rate")  * 100 for n in ns]
+    hyb_means  = [_lookup(idx, "hybrid", n, "mean_delivery_rate") * 100 for n in ns]
+    hyb_errs   = [_lookup(idx, "hybrid", n, "std_delivery_rate")  * 100 for n in ns]
     _grouped_bar(ax, ns, push_means, push_errs, hyb_means, hyb_errs,
                  "Delivery rate (%)",
                  "Message Delivery Rate — Push-only vs Hybrid")
     ax.set_ylim(0, 115)
     ax.axhline(95, color="red", linestyle="--", linewidth=1.2, label="95% target")
     ax.legend(fontsize=10)
-    plt.tight_layout()
+    fig.tight_layout()
     path = os.path.join(out_dir, "delivery_rate.png")
-    plt.savefig(path, dpi=150, bbox_inches="tight")
-    plt.close()
+    fig.savefig(path, dpi=150)
     print(f"[INFO] Plot saved     → {path}")
 
 
@@ -420,7 +761,9 @@ def plot_combined(summary, ns, out_dir):
     """2×2 summary grid."""
     if not HAS_PLOT:
         return
-    fig, axes = plt.subplots(2, 2, figsize=(13, 9))
+    idx = _summary_index(summary)
+    fig  = _get_fig((13, 9))
+    axes = fig.subplots(2, 2)
     fig.suptitle("Gossip Protocol — Performance Analysis Summary",
                  fontsize=14, fontweight="bold")
 
@@ -438,16 +781,15 @@ def plot_combined(summary, ns, out_dir):
 
     for ax, (mean_key, std_key, ylabel, title), sc in \
             zip(axes.flat, metrics, scale):
-        push_m = [_lookup(summary, "push",   n, mean_key) * sc for n in ns]
-        push_e = [_lookup(summary, "push",   n, std_key)  * sc for n in ns]
-        hyb_m  = [_lookup(summary, "hybrid", n, mean_key) * sc for n in ns]
-        hyb_e  = [_lookup(summary, "hybrid", n, std_key)  * sc for n in ns]
+        push_m = [_lookup(idx, "push",   n, mean_key) * sc for n in ns]
+        push_e = [_lookup(idx, "push",   n, std_key)  * sc for n in ns]
+        hyb_m  = [_lookup(idx, "hybrid", n, mean_key) * sc for n in ns]
+        hyb_e  = [_lookup(idx, "hybrid", n, std_key)  * sc for n in ns]
         _grouped_bar(ax, ns, push_m, push_e, hyb_m, hyb_e, ylabel, title)
 
-    plt.tight_layout()
+    fig.tight_layout()
     path = os.path.join(out_dir, "combined.png")
-    plt.savefig(path, dpi=150, bbox_inches="tight")
-    plt.close()
+    fig.savefig(path, dpi=150)
     print(f"[INFO] Plot saved     → {path}")
 
 
@@ -455,15 +797,16 @@ def plot_scatter(per_trial, out_dir):
     """Overhead vs convergence scatter, colored by mode."""
     if not HAS_PLOT:
         return
-    fig, ax = plt.subplots(figsize=(8, 6))
+    fig = _get_fig((8, 6))
+    ax  = fig.add_subplot(111)
 
     for mode, color in COLORS.items():
         pts = [
-            (r["overhead_sends"], r["convergence_ms"])
+            (r.overhead_sends, r.convergence_ms)
             for r in per_trial
-            if r["mode"] == mode
-               and r["convergence_ms"] is not None
-               and r["overhead_sends"] is not None
+            if r.mode == mode
+               and r.convergence_ms is not None
+               and r.overhead_sends is not None
         ]
         if pts:
             xs, ys = zip(*pts)
@@ -478,10 +821,9 @@ def plot_scatter(per_trial, out_dir):
     ax.xaxis.grid(True, linestyle="--", alpha=0.5)
     ax.set_axisbelow(True)
 
-    plt.tight_layout()
+    fig.tight_layout()
     path = os.path.join(out_dir, "scatter.png")
-    plt.savefig(path, dpi=150, bbox_inches="tight")
-    plt.close()
+    fig.savefig(path, dpi=150)
     print(f"[INFO] Plot saved     → {path}")
 
 
@@ -489,11 +831,13 @@ def plot_convergence_line(summary, ns, out_dir):
     """Line chart: convergence time vs N for both modes."""
     if not HAS_PLOT:
         return
-    fig, ax = plt.subplots(figsize=(8, 5))
+    idx = _summary_index(summary)
+    fig = _get_fig((8, 5))
+    ax  = fig.add_subplot(111)
 
     for mode, color in COLORS.items():
-        means  = [_lookup(summary, mode, n, "mean_convergence_ms") for n in ns]
-        stdevs = [_lookup(summary, mode, n, "std_convergence_ms")  for n in ns]
+        means  = [_lookup(idx, mode, n, "mean_convergence_ms") for n in ns]
+        stdevs = [_lookup(idx, mode, n, "std_convergence_ms")  for n in ns]
         ax.errorbar(ns, means, yerr=stdevs,
                     label=mode.replace("push", "Push-only").replace(
                         "hybrid", "Hybrid Push-Pull"),
@@ -507,10 +851,9 @@ def plot_convergence_line(summary, ns, out_dir):
     ax.legend(fontsize=10)
     ax.yaxis.grid(True, linestyle="--", alpha=0.5)
     ax.set_axisbelow(True)
-    plt.tight_layout()
+    fig.tight_layout()
     path = os.path.join(out_dir, "convergence_line.png")
-    plt.savefig(path, dpi=150, bbox_inches="tight")
-    plt.close()
+    fig.savefig(path, dpi=150)
     print(f"[INFO] Plot saved     → {path}")
 
 
@@ -532,12 +875,12 @@ def write_report(per_trial, summary, out_path):
     hdr += f"{'TotalSnd':>9} {'Delivery%':>10}"
     lines.append(hdr)
     lines.append("-" * 70)
-    for r in sorted(per_trial, key=lambda x: (x["mode"], x["n"], x["seed"])):
-        conv  = f"{r['convergence_ms']:.0f}" if r["convergence_ms"] is not None else "N/A"
+    for r in sorted(per_trial, key=lambda x: (x.mode, x.n, x.seed)):
+        conv  = f"{r.convergence_ms:.0f}" if r.convergence_ms is not None else "N/A"
         lines.append(
-            f"{r['mode']:<8} {r['n']:>5} {r['seed']:>6} "
-            f"{conv:>10} {r['overhead_sends']:>8} "
-            f"{r['total_sends']:>9} {r['delivery_rate']*100:>9.1f}%"
+            f"{r.mode:<8} {r.n:>5} {r.seed:>6} "
+            f"{conv:>10} {r.overhead_sends:>8} "
+            f"{r.total_sends:>9} {r.delivery_rate*100:>9.1f}%"
         )
     lines.append("")
 
@@ -604,8 +947,8 @@ def write_report(per_trial, summary, out_path):
     )
     lines.append("=" * 70)
 
-    with open(out_path, "w") as f:
-        f.write("\n".join(lines) + "\n")
+    with open(out_path, "w", buffering=1 << 20) as f:
+        f.writelines(l + "\n" for l in lines)
     print(f"[INFO] Text report    → {out_path}")
 
 
@@ -618,8 +961,6 @@ def generate_synthetic_data(results_dir: Path) -> None:
     Create synthetic log files so the analysis pipeline can be exercised
     without a running cluster.  Reflects realistic Gossip behaviour.
     """
-    import random, math
-
     print("[INFO] No real trial directories found. Generating synthetic logs …")
 
     modes   = ["push", "hybrid"]
@@ -628,12 +969,11 @@ def generate_synthetic_data(results_dir: Path) -> None:
     fanout  = 3
     base_ts = 1_700_000_000_000   # arbitrary epoch in ms
 
-    random.seed(0)
-
     for mode in modes:
         for n in n_list:
             for seed in seeds:
-                rng = random.Random(seed + n * 1000 + (0 if mode == "push" else 1))
+                rng = np.random.default_rng(
+                    seed + n * 1000 + (0 if mode == "push" else 1))
 
                 label    = f"{mode}_N{n}_s{seed}"
                 out_dir  = results_dir / label
@@ -646,64 +986,69 @@ def generate_synthetic_data(results_dir: Path) -> None:
                     conv_base   *= 1.05            # slightly slower
                     overhead_base = int(overhead_base * 0.65)  # 35% less overhead
 
-                noise = lambda base: max(1, int(base * (1 + rng.gauss(0, 0.12))))
+                noise = lambda base: max(1, int(base * (1 + rng.normal(0, 0.12))))
 
                 msg_id   = f"msg_{mode}_{n}_{seed}"
                 inject_ts = base_ts
 
                 # Simulate which nodes receive the message (95–100%)
-                n_recv    = max(int(0.95 * n), n - rng.randint(0, max(1, n // 20)))
+                n_recv    = max(int(0.95 * n),
+                                n - int(rng.integers(0, max(1, n // 20) + 1)))
                 conv_ms   = noise(conv_base)
                 # Spread receive events evenly over [0, conv_ms]
-                recv_times = sorted(
-                    inject_ts + int(rng.uniform(0, conv_ms))
-                    for _ in range(n_recv)
-                )
-
-                # Write one log per simulated node
-                events_per_node: dict[int, list[str]] = defaultdict(list)
-
-                # Injector node: SEND
-                events_per_node[0].append(
-                    f"{inject_ts},SEND,GOSSIP,{msg_id}"
-                )
-
-                # Gossip relay SENDs
-                n_sends = noise(overhead_base)
-                for _ in range(n_sends):
-                    ts      = inject_ts + rng.randint(0, conv_ms + 50)
-                    node_i  = rng.randint(0, n - 1)
-                    events_per_node[node_i].append(
-                        f"{ts},SEND,GOSSIP,{msg_id}"
-                    )
-
-                # RECEIVE events
-                for i, rts in enumerate(recv_times):
-                    node_i = (i % n) + 1 if n > 1 else 0
-                    events_per_node[node_i % n].append(
-                        f"{rts},RECEIVE,GOSSIP,{msg_id}"
-                    )
+                recv_times = np.sort(
+                    inject_ts + rng.integers(0, conv_ms, size=n_recv))
+
+                # Gossip relay SENDs — one batched draw per trial
+                n_sends    = noise(overhead_base)
+                send_ts    = inject_ts + rng.integers(0, conv_ms + 51,
+                                                      size=n_sends)
+                send_nodes = rng.integers(0, n, size=n_sends)
+
+                # RECEIVE events, assigned round-robin over nodes 1..n-1
+                if n > 1:
+                    recv_nodes = ((np.arange(n_recv) % n) + 1) % n
+                else:
+                    recv_nodes = np.zeros(n_recv, np.int64)
 
                 # Control messages (PING/PONG/HELLO etc.)
                 ctrl_types = ["PING", "PONG", "HELLO", "GET_PEERS", "PEERS_LIST"]
                 if mode == "hybrid":
                     ctrl_types += ["IHAVE", "IWANT"]
-                n_ctrl = noise(n * fanout * 3)
-                for _ in range(n_ctrl):
-                    ts     = inject_ts + rng.randint(-500, conv_ms + 500)
-                    ctype  = rng.choice(ctrl_types)
-                    cid    = f"ctrl_{rng.randint(0, 99999)}"
-                    node_i = rng.randint(0, n - 1)
-                    events_per_node[node_i].append(
-                        f"{ts},SEND,{ctype},{cid}"
-                    )
-
-                # Write one file per node
+                n_ctrl     = noise(n * fanout * 3)
+                ctrl_ts    = inject_ts + rng.integers(-500, conv_ms + 501,
+                                                      size=n_ctrl)
+                ctrl_kinds = rng.choice(ctrl_types, size=n_ctrl)
+                ctrl_ids   = rng.integers(0, 100000, size=n_ctrl)
+                ctrl_nodes = rng.integers(0, n, size=n_ctrl)
+
+                # Assemble all log lines in bulk in the numpy string layer
+                gossip_tail = f",SEND,GOSSIP,{msg_id}"
+                lines = np.concatenate([
+                    np.array([f"{inject_ts},SEND,GOSSIP,{msg_id}"]),
+                    np.char.add(send_ts.astype("U20"), gossip_tail),
+                    np.char.add(recv_times.astype("U20"),
+                                f",RECEIVE,GOSSIP,{msg_id}"),
+                    np.char.add(
+                        np.char.add(np.char.add(ctrl_ts.astype("U20"),
+                                                ",SEND,"), ctrl_kinds),
+                        np.char.add(",ctrl_", ctrl_ids.astype("U6"))),
+                ])
+                node_of = np.concatenate([
+                    np.zeros(1, np.int64), send_nodes, recv_nodes, ctrl_nodes,
+                ])
+
+                # Group lines by node and write each file in one shot
+                order    = np.argsort(node_of, kind="stable")
+                node_of  = node_of[order]
+                lines    = lines[order]
+                bounds   = np.searchsorted(node_of, np.arange(n + 1))
                 for node_i in range(n):
                     port    = 5000 + node_i
                     logfile = out_dir / f"node_{port}.log"
-                    lines   = sorted(events_per_node[node_i])
-                    logfile.write_text("\n".join(lines) + "\n")
+                    group   = lines[bounds[node_i]:bounds[node_i + 1]]
+                    with open(logfile, "w", buffering=1 << 16) as f:
+                        f.write("\n".join(sorted(group.tolist())) + "\n")
 
     print(f"[INFO] Synthetic logs written to {results_dir}/")
 
@@ -745,18 +1090,16 @@ def main():
 
     print(f"[INFO] Found {len(trials)} trial(s) in '{results_dir}'")
 
-    # ── Load & compute metrics ───────────────────────────────────────────────
+    # ── Load & compute metrics (one worker per trial, trials are independent) ─
     per_trial_rows = []
-    for trial in trials:
-        events = load_trial(trial["path"])
-        m      = compute_metrics(events, trial["n"])
-        row    = {**trial, **m}
-        row.pop("path", None)
-        per_trial_rows.append(row)
-        status = (f"conv={m['convergence_ms']}ms" if m["convergence_ms"] is not None
-                  else "conv=N/A")
-        print(f"       {trial['path'].name}  {status}  "
-              f"overhead={m['overhead_sends']}  delivery={m['delivery_rate']*100:.0f}%")
+    with mp.Pool(os.cpu_count()) as pool:
+        for trial, row in zip(trials, pool.imap(_process_trial, trials)):
+            per_trial_rows.append(row)
+            status = (f"conv={row.convergence_ms}ms"
+                      if row.convergence_ms is not None else "conv=N/A")
+            print(f"       {trial['path'].name}  {status}  "
+                  f"overhead={row.overhead_sends}  "
+                  f"delivery={row.delivery_rate*100:.0f}%")
 
     print()
 
@@ -768,13 +1111,21 @@ def main():
     save_per_trial_csv(per_trial_rows, str(out_dir / "analysis_results.csv"))
     save_summary_csv(summary,          str(out_dir / "analysis_summary.csv"))
 
-    # ── Plots ─────────────────────────────────────────────────────────────────
-    plot_convergence(summary, ns, str(out_dir))
-    plot_overhead(summary, ns, str(out_dir))
-    plot_delivery_rate(summary, ns, str(out_dir))
-    plot_combined(summary, ns, str(out_dir))
-    plot_scatter(per_trial_rows, str(out_dir))
-    plot_convergence_line(summary, ns, str(out_dir))
+    # ── Plots (skipped when the data they render is unchanged) ───────────────
+    if HAS_PLOT:
+        sig = hashlib.blake2b(json.dumps(
+            [[asdict(r) for r in per_trial_rows], summary], sort_keys=True,
+            default=str).encode()).hexdigest()
+        if _plots_up_to_date(out_dir, sig):
+            print("[INFO] Plots up to date — skipping render.")
+        else:
+            plot_convergence(summary, ns, str(out_dir))
+            plot_overhead(summary, ns, str(out_dir))
+            plot_delivery_rate(summary, ns, str(out_dir))
+            plot_combined(summary, ns, str(out_dir))
+            plot_scatter(per_trial_rows, str(out_dir))
+            plot_convergence_line(summary, ns, str(out_dir))
+            (out_dir / ".sig").write_text(sig)
 
     # ── Text report ───────────────────────────────────────────────────────────
     write_report(per_trial_rows, summary, str(out_dir / "analysis_report.txt"))
@@ -0,0 +1,701 @@
+/*
+ * pow_fast.c — optional CPython extension accelerating pow_benchmark.py.
+ *
+ * Mines SHA-256(node_id || str(nonce)) proof-of-work nonces entirely in C,
+ * using the Intel SHA extensions (SHA256RNDS2/MSG1/MSG2) when the CPU has
+ * them and a portable scalar compression otherwise.  Only the common case
+ * where prefix + decimal nonce fits a single 64-byte block is handled; the
+ * Python caller falls back to hashlib for anything longer.
+ *
+ * Build:  make powext          (produces _pow_fast.so next to the scripts)
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <stdint.h>
+#include <string.h>
+
+/* ── Scalar SHA-256 compression ─────────────────────────────────────────── */
+
+static const uint32_t K256[64] = {
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5,
+    0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3,
+    0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc,
+    0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7,
+    0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13,
+    0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3,
+    0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5,
+    0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208,
+    0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+};
+
+static const uint32_t IV256[8] = {
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a,
+    0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+};
+
+#define ROTR(x, n) (((x) >> (n)) | ((x) << (32 - (n))))
+
+static void sha256_block_scalar(uint32_t state[8], const uint8_t data[64])
+{
+    uint32_t w[64];
+    uint32_t a, b, c, d, e, f, g, h;
+    int i;
+
+    for (i = 0; i < 16; i++) {
+        w[i] = ((uint32_t)data[4 * i] << 24) |
+               ((uint32_t)data[4 * i + 1] << 16) |
+               ((uint32_t)data[4 * i + 2] << 8) |
+               ((uint32_t)data[4 * i + 3]);
+    }
+    for (i = 16; i < 64; i++) {
+        uint32_t s0 = ROTR(w[i - 15], 7) ^ ROTR(w[i - 15], 18) ^ (w[i - 15] >> 3);
+        uint32_t s1 = ROTR(w[i - 2], 17) ^ ROTR(w[i - 2], 19) ^ (w[i - 2] >> 10);
+        w[i] = w[i - 16] + s0 + w[i - 7] + s1;
+    }
+
+    a = state[0]; b = state[1]; c = state[2]; d = state[3];
+    e = state[4]; f = state[5]; g = state[6]; h = state[7];
+
+    for (i = 0; i < 64; i++) {
+        uint32_t S1 = ROTR(e, 6) ^ ROTR(e, 11) ^ ROTR(e, 25);
+        uint32_t ch = (e & f) ^ (~e & g);
+        uint32_t t1 = h + S1 + ch + K256[i] + w[i];
+        uint32_t S0 = ROTR(a, 2) ^ ROTR(a, 13) ^ ROTR(a, 22);
+        uint32_t maj = (a & b) ^ (a & c) ^ (b & c);
+        uint32_t t2 = S0 + maj;
+        h = g; g = f; f = e; e = d + t1;
+        d = c; c = b; b = a; a = t1 + t2;
+    }
+
+    state[0] += a; state[1] += b; state[2] += c; state[3] += d;
+    state[4] += e; state[5] += f; state[6] += g; state[7] += h;
+}
+
+/* ── SHA-NI SHA-256 compression (runtime-dispatched) ───────────────────── */
+
+#if defined(__x86_64__) || defined(__i386__)
+#define HAVE_SHANI_BUILD 1
+#include <immintrin.h>
+
+__attribute__((target("sha,sse4.1")))
+static void sha256_block_shani(uint32_t state[8], const uint8_t data[64])
+{
+    __m128i STATE0, STATE1, MSG, TMP;
+    __m128i MSG0, MSG1, MSG2, MSG3;
+    __m128i ABEF_SAVE, CDGH_SAVE;
+    const __m128i MASK = _mm_set_epi64x(0x0c0d0e0f08090a0bULL,
+                                        0x0405060700010203ULL);
+
+    /* Load and re-arrange state: ABCD,EFGH -> ABEF,CDGH */
+    TMP    = _mm_loadu_si128((const __m128i *)&state[0]);
+    STATE1 = _mm_loadu_si128((const __m128i *)&state[4]);
+    TMP    = _mm_shuffle_epi32(TMP, 0xB1);          /* CDAB */
+    STATE1 = _mm_shuffle_epi32(STATE1, 0x1B);       /* EFGH */
+    STATE0 = _mm_alignr_epi8(TMP, STATE1, 8);       /* ABEF */
+    STATE1 = _mm_blend_epi16(STATE1, TMP, 0xF0);    /* CDGH */
+
+    ABEF_SAVE = STATE0;
+    CDGH_SAVE = STATE1;
+
+    /* Rounds 0-3 */
+    MSG  = _mm_loadu_si128((const __m128i *)(data + 0));
+    MSG0 = _mm_shuffle_epi8(MSG, MASK);
+    MSG  = _mm_add_epi32(MSG0, _mm_set_epi64x(0xe9b5dba5b5c0fbcfULL, 0x71374491428a2f98ULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+
+    /* Rounds 4-7 */
+    MSG1 = _mm_loadu_si128((const __m128i *)(data + 16));
+    MSG1 = _mm_shuffle_epi8(MSG1, MASK);
+    MSG  = _mm_add_epi32(MSG1, _mm_set_epi64x(0xab1c5ed5923f82a4ULL, 0x59f111f13956c25bULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+    MSG0 = _mm_sha256msg1_epu32(MSG0, MSG1);
+
+    /* Rounds 8-11 */
+    MSG2 = _mm_loadu_si128((const __m128i *)(data + 32));
+    MSG2 = _mm_shuffle_epi8(MSG2, MASK);
+    MSG  = _mm_add_epi32(MSG2, _mm_set_epi64x(0x550c7dc3243185beULL, 0x12835b01d807aa98ULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+    MSG1 = _mm_sha256msg1_epu32(MSG1, MSG2);
+
+    /* Rounds 12-15 */
+    MSG3 = _mm_loadu_si128((const __m128i *)(data + 48));
+    MSG3 = _mm_shuffle_epi8(MSG3, MASK);
+    MSG  = _mm_add_epi32(MSG3, _mm_set_epi64x(0xc19bf1749bdc06a7ULL, 0x80deb1fe72be5d74ULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    TMP  = _mm_alignr_epi8(MSG3, MSG2, 4);
+    MSG0 = _mm_add_epi32(MSG0, TMP);
+    MSG0 = _mm_sha256msg2_epu32(MSG0, MSG3);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+    MSG2 = _mm_sha256msg1_epu32(MSG2, MSG3);
+
+    /* Rounds 16-19 */
+    MSG  = _mm_add_epi32(MSG0, _mm_set_epi64x(0x240ca1cc0fc19dc6ULL, 0xefbe4786e49b69c1ULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    TMP  = _mm_alignr_epi8(MSG0, MSG3, 4);
+    MSG1 = _mm_add_epi32(MSG1, TMP);
+    MSG1 = _mm_sha256msg2_epu32(MSG1, MSG0);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+    MSG3 = _mm_sha256msg1_epu32(MSG3, MSG0);
+
+    /* Rounds 20-23 */
+    MSG  = _mm_add_epi32(MSG1, _mm_set_epi64x(0x76f988da5cb0a9dcULL, 0x4a7484aa2de92c6fULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    TMP  = _mm_alignr_epi8(MSG1, MSG0, 4);
+    MSG2 = _mm_add_epi32(MSG2, TMP);
+    MSG2 = _mm_sha256msg2_epu32(MSG2, MSG1);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+    MSG0 = _mm_sha256msg1_epu32(MSG0, MSG1);
+
+    /* Rounds 24-27 */
+    MSG  = _mm_add_epi32(MSG2, _mm_set_epi64x(0xbf597fc7b00327c8ULL, 0xa831c66d983e5152ULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    TMP  = _mm_alignr_epi8(MSG2, MSG1, 4);
+    MSG3 = _mm_add_epi32(MSG3, TMP);
+    MSG3 = _mm_sha256msg2_epu32(MSG3, MSG2);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+    MSG1 = _mm_sha256msg1_epu32(MSG1, MSG2);
+
+    /* Rounds 28-31 */
+    MSG  = _mm_add_epi32(MSG3, _mm_set_epi64x(0x1429296706ca6351ULL, 0xd5a79147c6e00bf3ULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    TMP  = _mm_alignr_epi8(MSG3, MSG2, 4);
+    MSG0 = _mm_add_epi32(MSG0, TMP);
+    MSG0 = _mm_sha256msg2_epu32(MSG0, MSG3);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+    MSG2 = _mm_sha256msg1_epu32(MSG2, MSG3);
+
+    /* Rounds 32-35 */
+    MSG  = _mm_add_epi32(MSG0, _mm_set_epi64x(0x53380d134d2c6dfcULL, 0x2e1b213827b70a85ULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    TMP  = _mm_alignr_epi8(MSG0, MSG3, 4);
+    MSG1 = _mm_add_epi32(MSG1, TMP);
+    MSG1 = _mm_sha256msg2_epu32(MSG1, MSG0);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+    MSG3 = _mm_sha256msg1_epu32(MSG3, MSG0);
+
+    /* Rounds 36-39 */
+    MSG  = _mm_add_epi32(MSG1, _mm_set_epi64x(0x92722c8581c2c92eULL, 0x766a0abb650a7354ULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    TMP  = _mm_alignr_epi8(MSG1, MSG0, 4);
+    MSG2 = _mm_add_epi32(MSG2, TMP);
+    MSG2 = _mm_sha256msg2_epu32(MSG2, MSG1);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+    MSG0 = _mm_sha256msg1_epu32(MSG0, MSG1);
+
+    /* Rounds 40-43 */
+    MSG  = _mm_add_epi32(MSG2, _mm_set_epi64x(0xc76c51a3c24b8b70ULL, 0xa81a664ba2bfe8a1ULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    TMP  = _mm_alignr_epi8(MSG2, MSG1, 4);
+    MSG3 = _mm_add_epi32(MSG3, TMP);
+    MSG3 = _mm_sha256msg2_epu32(MSG3, MSG2);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+    MSG1 = _mm_sha256msg1_epu32(MSG1, MSG2);
+
+    /* Rounds 44-47 */
+    MSG  = _mm_add_epi32(MSG3, _mm_set_epi64x(0x106aa070f40e3585ULL, 0xd6990624d192e819ULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    TMP  = _mm_alignr_epi8(MSG3, MSG2, 4);
+    MSG0 = _mm_add_epi32(MSG0, TMP);
+    MSG0 = _mm_sha256msg2_epu32(MSG0, MSG3);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+    MSG2 = _mm_sha256msg1_epu32(MSG2, MSG3);
+
+    /* Rounds 48-51 */
+    MSG  = _mm_add_epi32(MSG0, _mm_set_epi64x(0x34b0bcb52748774cULL, 0x1e376c0819a4c116ULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    TMP  = _mm_alignr_epi8(MSG0, MSG3, 4);
+    MSG1 = _mm_add_epi32(MSG1, TMP);
+    MSG1 = _mm_sha256msg2_epu32(MSG1, MSG0);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+    MSG3 = _mm_sha256msg1_epu32(MSG3, MSG0);
+
+    /* Rounds 52-55 */
+    MSG  = _mm_add_epi32(MSG1, _mm_set_epi64x(0x682e6ff35b9cca4fULL, 0x4ed8aa4a391c0cb3ULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    TMP  = _mm_alignr_epi8(MSG1, MSG0, 4);
+    MSG2 = _mm_add_epi32(MSG2, TMP);
+    MSG2 = _mm_sha256msg2_epu32(MSG2, MSG1);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+
+    /* Rounds 56-59 */
+    MSG  = _mm_add_epi32(MSG2, _mm_set_epi64x(0x8cc7020884c87814ULL, 0x78a5636f748f82eeULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    TMP  = _mm_alignr_epi8(MSG2, MSG1, 4);
+    MSG3 = _mm_add_epi32(MSG3, TMP);
+    MSG3 = _mm_sha256msg2_epu32(MSG3, MSG2);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+
+    /* Rounds 60-63 */
+    MSG  = _mm_add_epi32(MSG3, _mm_set_epi64x(0xc67178f2bef9a3f7ULL, 0xa4506ceb90befffaULL));
+    STATE1 = _mm_sha256rnds2_epu32(STATE1, STATE0, MSG);
+    MSG  = _mm_shuffle_epi32(MSG, 0x0E);
+    STATE0 = _mm_sha256rnds2_epu32(STATE0, STATE1, MSG);
+
+    STATE0 = _mm_add_epi32(STATE0, ABEF_SAVE);
+    STATE1 = _mm_add_epi32(STATE1, CDGH_SAVE);
+
+    /* ABEF,CDGH -> ABCD,EFGH */
+    TMP    = _mm_shuffle_epi32(STATE0, 0x1B);       /* FEBA */
+    STATE1 = _mm_shuffle_epi32(STATE1, 0xB1);       /* DCHG */
+    STATE0 = _mm_blend_epi16(TMP, STATE1, 0xF0);    /* DCBA */
+    STATE1 = _mm_alignr_epi8(STATE1, TMP, 8);       /* HGFE */
+
+    _mm_storeu_si128((__m128i *)&state[0], STATE0);
+    _mm_storeu_si128((__m128i *)&state[4], STATE1);
+}
+
+/*
+ * 2-way interleaved variant: compresses two independent blocks at once.
+ * SHA256RNDS2 has multi-cycle latency, so interleaving two dependency
+ * chains roughly doubles throughput.  Each logical register becomes a
+ * two-lane array; gcc unrolls the constant-trip lane loops and schedules
+ * the lanes against each other.
+ */
+#define SHANI_ROUNDS4_X2(KHI, KLO, Wa, Wb, Wd)                              \
+    for (l = 0; l < 2; l++) {                                               \
+        M[l]  = _mm_add_epi32(Wa[l], _mm_set_epi64x(KHI, KLO));             \
+        S1[l] = _mm_sha256rnds2_epu32(S1[l], S0[l], M[l]);                  \
+        T[l]  = _mm_alignr_epi8(Wa[l], Wd[l], 4);                           \
+        Wb[l] = _mm_add_epi32(Wb[l], T[l]);                                 \
+        Wb[l] = _mm_sha256msg2_epu32(Wb[l], Wa[l]);                         \
+        M[l]  = _mm_shuffle_epi32(M[l], 0x0E);                              \
+        S0[l] = _mm_sha256rnds2_epu32(S0[l], S1[l], M[l]);                  \
+        Wd[l] = _mm_sha256msg1_epu32(Wd[l], Wa[l]);                         \
+    }
+
+__attribute__((target("sha,sse4.1")))
+static void sha256_block_shani_x2(uint32_t stateA[8], uint32_t stateB[8],
+                                  const uint8_t dataA[64],
+                                  const uint8_t dataB[64])
+{
+    __m128i S0[2], S1[2], M[2], T[2];
+    __m128i W0[2], W1[2], W2[2], W3[2];
+    __m128i SV0[2], SV1[2];
+    const __m128i MASK = _mm_set_epi64x(0x0c0d0e0f08090a0bULL,
+                                        0x0405060700010203ULL);
+    uint32_t *state[2];
+    const uint8_t *data[2];
+    int l;
+
+    state[0] = stateA; state[1] = stateB;
+    data[0] = dataA; data[1] = dataB;
+
+    for (l = 0; l < 2; l++) {
+        T[l]  = _mm_loadu_si128((const __m128i *)&state[l][0]);
+        S1[l] = _mm_loadu_si128((const __m128i *)&state[l][4]);
+        T[l]  = _mm_shuffle_epi32(T[l], 0xB1);
+        S1[l] = _mm_shuffle_epi32(S1[l], 0x1B);
+        S0[l] = _mm_alignr_epi8(T[l], S1[l], 8);
+        S1[l] = _mm_blend_epi16(S1[l], T[l], 0xF0);
+        SV0[l] = S0[l];
+        SV1[l] = S1[l];
+    }
+
+    /* Rounds 0-3 */
+    for (l = 0; l < 2; l++) {
+        M[l]  = _mm_loadu_si128((const __m128i *)(data[l] + 0));
+        W0[l] = _mm_shuffle_epi8(M[l], MASK);
+        M[l]  = _mm_add_epi32(W0[l], _mm_set_epi64x(0xe9b5dba5b5c0fbcfULL, 0x71374491428a2f98ULL));
+        S1[l] = _mm_sha256rnds2_epu32(S1[l], S0[l], M[l]);
+        M[l]  = _mm_shuffle_epi32(M[l], 0x0E);
+        S0[l] = _mm_sha256rnds2_epu32(S0[l], S1[l], M[l]);
+    }
+
+    /* Rounds 4-7 */
+    for (l = 0; l < 2; l++) {
+        W1[l] = _mm_loadu_si128((const __m128i *)(data[l] + 16));
+        W1[l] = _mm_shuffle_epi8(W1[l], MASK);
+        M[l]  = _mm_add_epi32(W1[l], _mm_set_epi64x(0xab1c5ed5923f82a4ULL, 0x59f111f13956c25bULL));
+        S1[l] = _mm_sha256rnds2_epu32(S1[l], S0[l], M[l]);
+        M[l]  = _mm_shuffle_epi32(M[l], 0x0E);
+        S0[l] = _mm_sha256rnds2_epu32(S0[l], S1[l], M[l]);
+        W0[l] = _mm_sha256msg1_epu32(W0[l], W1[l]);
+    }
+
+    /* Rounds 8-11 */
+    for (l = 0; l < 2; l++) {
+        W2[l] = _mm_loadu_si128((const __m128i *)(data[l] + 32));
+        W2[l] = _mm_shuffle_epi8(W2[l], MASK);
+        M[l]  = _mm_add_epi32(W2[l], _mm_set_epi64x(0x550c7dc3243185beULL, 0x12835b01d807aa98ULL));
+        S1[l] = _mm_sha256rnds2_epu32(S1[l], S0[l], M[l]);
+        M[l]  = _mm_shuffle_epi32(M[l], 0x0E);
+        S0[l] = _mm_sha256rnds2_epu32(S0[l], S1[l], M[l]);
+        W1[l] = _mm_sha256msg1_epu32(W1[l], W2[l]);
+    }
+
+    /* Rounds 12-15 */
+    for (l = 0; l < 2; l++) {
+        W3[l] = _mm_loadu_si128((const __m128i *)(data[l] + 48));
+        W3[l] = _mm_shuffle_epi8(W3[l], MASK);
+    }
+    SHANI_ROUNDS4_X2(0xc19bf1749bdc06a7ULL, 0x80deb1fe72be5d74ULL, W3, W0, W2)
+    /* Rounds 16-19 */
+    SHANI_ROUNDS4_X2(0x240ca1cc0fc19dc6ULL, 0xefbe4786e49b69c1ULL, W0, W1, W3)
+    /* Rounds 20-23 */
+    SHANI_ROUNDS4_X2(0x76f988da5cb0a9dcULL, 0x4a7484aa2de92c6fULL, W1, W2, W0)
+    /* Rounds 24-27 */
+    SHANI_ROUNDS4_X2(0xbf597fc7b00327c8ULL, 0xa831c66d983e5152ULL, W2, W3, W1)
+    /* Rounds 28-31 */
+    SHANI_ROUNDS4_X2(0x1429296706ca6351ULL, 0xd5a79147c6e00bf3ULL, W3, W0, W2)
+    /* Rounds 32-35 */
+    SHANI_ROUNDS4_X2(0x53380d134d2c6dfcULL, 0x2e1b213827b70a85ULL, W0, W1, W3)
+    /* Rounds 36-39 */
+    SHANI_ROUNDS4_X2(0x92722c8581c2c92eULL, 0x766a0abb650a7354ULL, W1, W2, W0)
+    /* Rounds 40-43 */
+    SHANI_ROUNDS4_X2(0xc76c51a3c24b8b70ULL, 0xa81a664ba2bfe8a1ULL, W2, W3, W1)
+    /* Rounds 44-47 */
+    SHANI_ROUNDS4_X2(0x106aa070f40e3585ULL, 0xd6990624d192e819ULL, W3, W0, W2)
+    /* Rounds 48-51 */
+    SHANI_ROUNDS4_X2(0x34b0bcb52748774cULL, 0x1e376c0819a4c116ULL, W0, W1, W3)
+
+    /* Rounds 52-55 */
+    for (l = 0; l < 2; l++) {
+        M[l]  = _mm_add_epi32(W1[l], _mm_set_epi64x(0x682e6ff35b9cca4fULL, 0x4ed8aa4a391c0cb3ULL));
+        S1[l] = _mm_sha256rnds2_epu32(S1[l], S0[l], M[l]);
+        T[l]  = _mm_alignr_epi8(W1[l], W0[l], 4);
+        W2[l] = _mm_add_epi32(W2[l], T[l]);
+        W2[l] = _mm_sha256msg2_epu32(W2[l], W1[l]);
+        M[l]  = _mm_shuffle_epi32(M[l], 0x0E);
+        S0[l] = _mm_sha256rnds2_epu32(S0[l], S1[l], M[l]);
+    }
+
+    /* Rounds 56-59 */
+    for (l = 0; l < 2; l++) {
+        M[l]  = _mm_add_epi32(W2[l], _mm_set_epi64x(0x8cc7020884c87814ULL, 0x78a5636f748f82eeULL));
+        S1[l] = _mm_sha256rnds2_epu32(S1[l], S0[l], M[l]);
+        T[l]  = _mm_alignr_epi8(W2[l], W1[l], 4);
+        W3[l] = _mm_add_epi32(W3[l], T[l]);
+        W3[l] = _mm_sha256msg2_epu32(W3[l], W2[l]);
+        M[l]  = _mm_shuffle_epi32(M[l], 0x0E);
+        S0[l] = _mm_sha256rnds2_epu32(S0[l], S1[l], M[l]);
+    }
+
+    /* Rounds 60-63 */
+    for (l = 0; l < 2; l++) {
+        M[l]  = _mm_add_epi32(W3[l], _mm_set_epi64x(0xc67178f2bef9a3f7ULL, 0xa4506ceb90befffaULL));
+        S1[l] = _mm_sha256rnds2_epu32(S1[l], S0[l], M[l]);
+        M[l]  = _mm_shuffle_epi32(M[l], 0x0E);
+        S0[l] = _mm_sha256rnds2_epu32(S0[l], S1[l], M[l]);
+    }
+
+    for (l = 0; l < 2; l++) {
+        S0[l] = _mm_add_epi32(S0[l], SV0[l]);
+        S1[l] = _mm_add_epi32(S1[l], SV1[l]);
+        T[l]  = _mm_shuffle_epi32(S0[l], 0x1B);
+        S1[l] = _mm_shuffle_epi32(S1[l], 0xB1);
+        S0[l] = _mm_blend_epi16(T[l], S1[l], 0xF0);
+        S1[l] = _mm_alignr_epi8(S1[l], T[l], 8);
+        _mm_storeu_si128((__m128i *)&state[l][0], S0[l]);
+        _mm_storeu_si128((__m128i *)&state[l][4], S1[l]);
+    }
+}
+#endif /* x86 */
+
+/* Selected at module init */
+static void (*sha256_block)(uint32_t[8], const uint8_t[64]) = sha256_block_scalar;
+static int use_shani = 0;
+
+/* ── Mining helpers ─────────────────────────────────────────────────────── */
+
+/* True when the first k hex digits of the digest (state words) are zero.
+ * Packing the first two words into a uint64 turns the common k <= 16 case
+ * into a single shift-and-compare instead of a per-word loop. */
+static inline int leading_hex_zeros_ok(const uint32_t st[8], int k)
+{
+    uint64_t w01;
+    int bits, i;
+
+    if (k == 0)
+        return 1;
+    w01 = ((uint64_t)st[0] << 32) | st[1];
+    if (k <= 16)
+        return (w01 >> (64 - 4 * k)) == 0;
+    if (w01 != 0)
+        return 0;
+    /* k > 16: fall back to scanning the remaining words. */
+    bits = 4 * k - 64;
+    for (i = 2; i < 8 && bits > 0; i++) {
+        if (bits >= 32) {
+            if (st[i] != 0)
+                return 0;
+            bits -= 32;
+        } else {
+            return (st[i] >> (32 - bits)) == 0;
+        }
+    }
+    return 1;
+}
+
+static void store_be32(uint8_t *p, uint32_t v)
+{
+    p[0] = (uint8_t)(v >> 24);
+    p[1] = (uint8_t)(v >> 16);
+    p[2] = (uint8_t)(v >> 8);
+    p[3] = (uint8_t)v;
+}
+
+/* Write decimal digits of v at p, return digit count. */
+static int write_decimal(uint8_t *p, unsigned long long v)
+{
+    char tmp[20];
+    int n = 0, i;
+    if (v == 0) {
+        p[0] = '0';
+        return 1;
+    }
+    while (v > 0) {
+        tmp[n++] = (char)('0' + (v % 10));
+        v /= 10;
+    }
+    for (i = 0; i < n; i++)
+        p[i] = (uint8_t)tmp[n - 1 - i];
+    return n;
+}
+
+/* Append SHA-256 padding for a single-block message of `len` bytes. */
+static void pad_block(uint8_t block[64], Py_ssize_t len)
+{
+    block[len] = 0x80;
+    memset(block + len + 1, 0, (size_t)(60 - len - 1));
+    store_be32(block + 60, (uint32_t)(len * 8));
+}
+
+/* ── Python interface ───────────────────────────────────────────────────── */
+
+PyDoc_STRVAR(mine_doc,
+"mine(prefix: bytes, k: int, start_nonce: int) -> (nonce, digest, attempts)\n\
+\n\
+Find the smallest nonce >= start_nonce whose SHA-256(prefix + str(nonce))\n\
+starts with k zero hex digits.  prefix + digits must fit one SHA-256\n\
+block (len(prefix) <= 35).");
+
+static PyObject *pow_mine(PyObject *self, PyObject *args)
+{
+    Py_buffer prefix;
+    int k;
+    unsigned long long start, nonce;
+    Py_ssize_t prev_len;
+    uint8_t block[64];
+    uint32_t state[8];
+    uint8_t digest[32];
+    int i;
+
+    (void)self;
+    if (!PyArg_ParseTuple(args, "y*iK", &prefix, &k, &start))
+        return NULL;
+    if (k < 0 || k > 64) {
+        PyBuffer_Release(&prefix);
+        PyErr_SetString(PyExc_ValueError, "k must be in [0, 64]");
+        return NULL;
+    }
+    if (prefix.len > 35) {   /* 35 + 20 digits + padding > one block */
+        PyBuffer_Release(&prefix);
+        PyErr_SetString(PyExc_ValueError,
+                        "prefix too long for single-block mining");
+        return NULL;
+    }
+
+    /* The prefix never changes: copy it into the block once and rewrite only
+     * the digit tail per attempt.  The padding depends solely on the digit
+     * count, so it is refreshed only when the nonce gains a digit. */
+    memcpy(block, prefix.buf, (size_t)prefix.len);
+    prev_len = -1;
+    for (nonce = start;; nonce++) {
+        Py_ssize_t len = prefix.len + write_decimal(block + prefix.len, nonce);
+        if (len != prev_len) {
+            pad_block(block, len);
+            prev_len = len;
+        }
+        memcpy(state, IV256, sizeof state);
+        sha256_block(state, block);
+        if (leading_hex_zeros_ok(state, k))
+            break;
+    }
+
+    PyBuffer_Release(&prefix);
+    for (i = 0; i < 8; i++)
+        store_be32(digest + 4 * i, state[i]);
+    return Py_BuildValue("(Ky#K)", nonce, (const char *)digest,
+                         (Py_ssize_t)32, nonce - start + 1);
+}
+
+PyDoc_STRVAR(try_range_doc,
+"try_range(prefix: bytes, start: int, count: int, k: int)\n\
+    -> (nonce, digest, attempts)\n\
+\n\
+Scan nonces [start, start + count).  Returns (nonce, digest, attempts)\n\
+on success or (-1, None, count) when no nonce in the range qualifies.\n\
+Uses a 2-way interleaved SHA-NI compression when available.  The GIL is\n\
+released for the duration of the scan, so calls on separate Python\n\
+threads mine in true parallel.");
+
+static PyObject *pow_try_range(PyObject *self, PyObject *args)
+{
+    Py_buffer prefix;
+    int k;
+    unsigned long long start, count, n, end;
+    Py_ssize_t prev_len_a, prev_len_b;
+    uint8_t block_a[64], block_b[64];
+    uint32_t state_a[8], state_b[8];
+    uint8_t digest[32];
+    unsigned long long found = 0;
+    const uint32_t *winner = NULL;
+    int i;
+
+    (void)self;
+    if (!PyArg_ParseTuple(args, "y*KKi", &prefix, &start, &count, &k))
+        return NULL;
+    if (k < 0 || k > 64) {
+        PyBuffer_Release(&prefix);
+        PyErr_SetString(PyExc_ValueError, "k must be in [0, 64]");
+        return NULL;
+    }
+    if (prefix.len > 35) {
+        PyBuffer_Release(&prefix);
+        PyErr_SetString(PyExc_ValueError,
+                        "prefix too long for single-block mining");
+        return NULL;
+    }
+
+    memcpy(block_a, prefix.buf, (size_t)prefix.len);
+    prev_len_a = -1;
+    n = start;
+    end = start + count;
+
+    /* The scan calls no Python API and only reads the held buffer view, so
+     * the GIL can be dropped for its whole duration — concurrent try_range
+     * calls then run on separate cores. */
+    Py_BEGIN_ALLOW_THREADS
+
+#ifdef HAVE_SHANI_BUILD
+    if (use_shani) {
+        /* Two independent nonces per compression call. */
+        memcpy(block_b, prefix.buf, (size_t)prefix.len);
+        prev_len_b = -1;
+        while (n + 1 < end) {
+            Py_ssize_t len;
+            len = prefix.len + write_decimal(block_a + prefix.len, n);
+            if (len != prev_len_a) {
+                pad_block(block_a, len);
+                prev_len_a = len;
+            }
+            len = prefix.len + write_decimal(block_b + prefix.len, n + 1);
+            if (len != prev_len_b) {
+                pad_block(block_b, len);
+                prev_len_b = len;
+            }
+            memcpy(state_a, IV256, sizeof state_a);
+            memcpy(state_b, IV256, sizeof state_b);
+            sha256_block_shani_x2(state_a, state_b, block_a, block_b);
+            if (leading_hex_zeros_ok(state_a, k)) {
+                found = n;
+                winner = state_a;
+                break;
+            }
+            if (leading_hex_zeros_ok(state_b, k)) {
+                found = n + 1;
+                winner = state_b;
+                break;
+            }
+            n += 2;
+        }
+    }
+#else
+    (void)block_b;
+    (void)state_b;
+    (void)prev_len_b;
+#endif
+
+    /* Scalar path and odd-count tail. */
+    if (winner == NULL) {
+        prev_len_a = -1;
+        while (n < end) {
+            Py_ssize_t len = prefix.len +
+                             write_decimal(block_a + prefix.len, n);
+            if (len != prev_len_a) {
+                pad_block(block_a, len);
+                prev_len_a = len;
+            }
+            memcpy(state_a, IV256, sizeof state_a);
+            sha256_block(state_a, block_a);
+            if (leading_hex_zeros_ok(state_a, k)) {
+                found = n;
+                winner = state_a;
+                break;
+            }
+            n++;
+        }
+    }
+
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&prefix);
+    if (winner == NULL)
+        return Py_BuildValue("(LOK)", -1LL, Py_None, count);
+    for (i = 0; i < 8; i++)
+        store_be32(digest + 4 * i, winner[i]);
+    return Py_BuildValue("(Ly#K)", (long long)found, (const char *)digest,
+                         (Py_ssize_t)32, found - start + 1);
+}
+
+static PyMethodDef pow_methods[] = {
+    {"mine", pow_mine, METH_VARARGS, mine_doc},
+    {"try_range", pow_try_range, METH_VARARGS, try_range_doc},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef pow_module = {
+    PyModuleDef_HEAD_INIT, "_pow_fast",
+    "SHA-NI accelerated proof-of-work mining loop.", -1, pow_methods,
+    NULL, NULL, NULL, NULL,
+};
+
+PyMODINIT_FUNC PyInit__pow_fast(void)
+{
+    PyObject *m;
+#ifdef HAVE_SHANI_BUILD
+    if (__builtin_cpu_supports("sha") && getenv("POW_FAST_NO_SHANI") == NULL) {
+        sha256_block = sha256_block_shani;
+        use_shani = 1;
+    }
+#endif
+    m = PyModule_Create(&pow_module);
+    if (m == NULL)
+        return NULL;
+#ifdef HAVE_SHANI_BUILD
+    if (PyModule_AddIntConstant(m, "USES_SHANI",
+                                __builtin_cpu_supports("sha")) < 0)
+        return NULL;
+#else
+    if (PyModule_AddIntConstant(m, "USES_SHANI", 0) < 0)
+        return NULL;
+#endif
+    return m;
+}